@@ -18,6 +18,10 @@ class HelloModel:
         self.width = 80
         self.height = 24
         self.counter = 0
+        # Static chrome is rendered once; only the counter changes per frame
+        self._border_style = Style().border(ROUNDED_BORDER).border_fg("#555555").padding(1, 2)
+        self._title = Style().bold().fg("#FAFAFA").bg("#7D56F4").padding(0, 1).render("snaptui")
+        self._help = Style().dim().render("j/k: change counter  q: quit")
 
     def init(self) -> Cmd:
         return None
@@ -36,16 +40,9 @@ class HelloModel:
         return self, None
 
     def view(self) -> str:
-        title_style = Style().bold().fg("#FAFAFA").bg("#7D56F4").padding(0, 1)
-        border_style = Style().border(ROUNDED_BORDER).border_fg("#555555").padding(1, 2)
-        help_style = Style().dim()
-
-        title = title_style.render("snaptui")
         counter = f"Counter: {self.counter}"
-        help_text = help_style.render("j/k: change counter  q: quit")
-
-        content = join_vertical(CENTER, title, "", counter, "", help_text)
-        box = border_style.render(content)
+        content = join_vertical(CENTER, self._title, "", counter, "", self._help)
+        box = self._border_style.render(content)
         return place(self.width, self.height, 0.5, 0.4, box)
 
 
@@ -4,7 +4,7 @@ A zero-dependency TUI framework implementing the Elm Architecture
 with raw terminal I/O, matching Bubble Tea's approach.
 """
 
-from .model import Model, Msg, Cmd, View, WindowSizeMsg, QuitMsg, CursorBlinkMsg, Sub, quit_cmd, batch, set_clipboard, set_primary_clipboard, read_clipboard, read_primary_clipboard
+from .model import Model, Msg, Cmd, View, WindowSizeMsg, QuitMsg, CursorBlinkMsg, Sub, quit_cmd, tick, batch, set_clipboard, set_primary_clipboard, read_clipboard, read_primary_clipboard
 from .keys import KeyMsg, Mod, MouseMsg, MouseAction, MouseButton, PasteMsg, FocusMsg, ClipboardMsg
 from .program import Program
 from .style import Style, ROUNDED_BORDER, NORMAL_BORDER, DOUBLE_BORDER, THICK_BORDER, HIDDEN_BORDER, NO_BORDER, Border
@@ -15,7 +15,7 @@ from . import strutil
 
 __all__ = [
     # Core
-    'Model', 'Msg', 'Cmd', 'View', 'WindowSizeMsg', 'QuitMsg', 'CursorBlinkMsg', 'Sub', 'quit_cmd', 'batch',
+    'Model', 'Msg', 'Cmd', 'View', 'WindowSizeMsg', 'QuitMsg', 'CursorBlinkMsg', 'Sub', 'quit_cmd', 'tick', 'batch',
     'set_clipboard', 'set_primary_clipboard', 'read_clipboard', 'read_primary_clipboard',
     'KeyMsg', 'Mod', 'MouseMsg', 'MouseAction', 'MouseButton', 'PasteMsg', 'FocusMsg', 'ClipboardMsg', 'Program',
     # Style + Theme
@@ -11,8 +11,13 @@ from ..keys import KeyMsg
 from ..model import Cmd, Msg
 from ..style import Style
 
+# Fallback styles when no theme is applied (built once, not per frame)
+_DEFAULT_SELECTED = Style().bold().reverse()
+_DEFAULT_BLURRED = Style()
+_KEYS_TOGGLE = frozenset({'left', 'h', 'right', 'l', 'tab'})
 
-@dataclass
+
+@dataclass(slots=True)
 class Confirm:
     """Yes/No confirmation prompt.
 
@@ -46,7 +51,7 @@ class Confirm:
 
         key = msg.key
 
-        if key in ('left', 'h', 'right', 'l', 'tab'):
+        if key in _KEYS_TOGGLE:
             self.value = not self.value
         elif key == 'y':
             self.value = True
@@ -65,8 +70,8 @@ class Confirm:
             p = self.prompt_style.render(p)
         lines.append(p)
 
-        ss = self.selected_style or Style().bold().reverse()
-        ns = self.blurred_style or Style()
+        ss = self.selected_style or _DEFAULT_SELECTED
+        ns = self.blurred_style or _DEFAULT_BLURRED
 
         yes_text = f' {self.affirmative} '
         no_text = f' {self.negative} '
@@ -7,25 +7,82 @@ with Tab/Shift+Tab navigation between them.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable
 
 from ..keys import KeyMsg
 from ..model import Cmd, Msg
 from ..style import Style
 from ..theme import Theme, ThemeCharm
-from .textinput import TextInput
-from .select import Select
-from .confirm import Confirm
 
+if TYPE_CHECKING:
+    from .textinput import TextInput
+    from .select import Select
+    from .confirm import Confirm
 
-@dataclass
+
+@dataclass(slots=True)
 class FormField:
     """Wrapper for a field in the form."""
     component: Any  # TextInput, Select, Confirm, etc.
     key: str = ''  # Identifier for retrieving values
+    # (theme base style, themed view) from the last frame
+    _view: tuple[Style | None, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+
+def _theme_textinput(t: Theme, comp: TextInput) -> None:
+    if comp.label_style is None:
+        comp.label_style = t.title
+    if comp.prompt_style is None:
+        comp.prompt_style = t.prompt
+    if comp.cursor_style is None:
+        comp.cursor_style = t.cursor
+    if comp.placeholder_style is None:
+        comp.placeholder_style = t.placeholder
+    if not comp.cursor_blink:
+        comp.cursor_blink = t.cursor_blink
+
+
+def _theme_select(t: Theme, comp: Select) -> None:
+    if comp.label_style is None:
+        comp.label_style = t.title
+    if comp.cursor_style is None:
+        comp.cursor_style = t.select_cursor
+    if comp.selected_style is None:
+        comp.selected_style = t.selected_option
+
+
+def _theme_confirm(t: Theme, comp: Confirm) -> None:
+    if comp.prompt_style is None:
+        comp.prompt_style = t.title
+    if comp.selected_style is None:
+        comp.selected_style = t.focused_button
+    if comp.blurred_style is None:
+        comp.blurred_style = t.blurred_button
+
+
+# Signature of a field for the key index: a replaced field, key or
+# component shows up as a changed entry
+_FIELD_SIG = attrgetter('key', 'component')
+
+# Filled on first use so importing form.py doesn't pull in every component
+_THEME_APPLIERS: dict[type, Callable[[Theme, Any], None]] = {}
+
 
+def _theme_appliers() -> dict[type, Callable[[Theme, Any], None]]:
+    if not _THEME_APPLIERS:
+        from .textinput import TextInput
+        from .select import Select
+        from .confirm import Confirm
+        _THEME_APPLIERS.update({
+            TextInput: _theme_textinput,
+            Select: _theme_select,
+            Confirm: _theme_confirm,
+        })
+    return _THEME_APPLIERS
 
-@dataclass
+
+@dataclass(slots=True)
 class Form:
     """Tab-navigable form grouping multiple input fields.
 
@@ -35,6 +92,11 @@ class Form:
         submitted: Whether the form has been submitted
         cancelled: Whether the form was cancelled
         theme: Theme applied to components on add_field (default ThemeCharm)
+
+    Each field's rendered view is kept between frames and redrawn when the
+    form updates or moves focus to it, or when its theme style changes.
+    After changing a component directly (set_value(), attribute edits),
+    call refresh() so the next view() picks it up.
     """
     fields: list[FormField] = field(default_factory=list)
     focused_index: int = 0
@@ -46,6 +108,13 @@ class Form:
     # Styles
     title_style: Style | None = None
 
+    # key -> index of the first field with that key whose component exposes
+    # .value, and indices of keyed fields that do; rebuilt when the
+    # (key, component) signature of the fields no longer matches _index_sig
+    _key_index: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _value_fields: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _index_sig: list[tuple[str, Any]] | None = field(default=None, init=False, repr=False, compare=False)
+
     def title(self, text: str) -> 'Form':
         self._title = text
         return self
@@ -60,140 +129,166 @@ class Form:
         """Apply theme defaults to a component (only fills unset styles)."""
         if self.theme is None:
             return
-        t = self.theme
-        if isinstance(comp, TextInput):
-            if comp.label_style is None:
-                comp.label_style = t.title
-            if comp.prompt_style is None:
-                comp.prompt_style = t.prompt
-            if comp.cursor_style is None:
-                comp.cursor_style = t.cursor
-            if comp.placeholder_style is None:
-                comp.placeholder_style = t.placeholder
-            if not comp.cursor_blink:
-                comp.cursor_blink = t.cursor_blink
-        elif isinstance(comp, Select):
-            if comp.label_style is None:
-                comp.label_style = t.title
-            if comp.cursor_style is None:
-                comp.cursor_style = t.select_cursor
-            if comp.selected_style is None:
-                comp.selected_style = t.selected_option
-        elif isinstance(comp, Confirm):
-            if comp.prompt_style is None:
-                comp.prompt_style = t.title
-            if comp.selected_style is None:
-                comp.selected_style = t.focused_button
-            if comp.blurred_style is None:
-                comp.blurred_style = t.blurred_button
+        appliers = _theme_appliers()
+        apply = appliers.get(type(comp))
+        if apply is None:
+            # Subclasses of the built-in fields resolve via their MRO
+            for cls in type(comp).__mro__[1:]:
+                apply = appliers.get(cls)
+                if apply is not None:
+                    break
+            else:
+                return
+        apply(self.theme, comp)
+
+    def refresh(self) -> None:
+        """Drop cached field views (call after mutating a component directly)."""
+        for f in self.fields:
+            f._view = None
 
     def focus_field(self, index: int) -> None:
         """Focus a specific field by index."""
         if self.fields:
-            # Blur current
-            if 0 <= self.focused_index < len(self.fields):
-                self.fields[self.focused_index].component.blur()
-            # Focus new
-            self.focused_index = max(0, min(index, len(self.fields) - 1))
-            self.fields[self.focused_index].component.focus()
+            self._set_focus(max(0, min(index, len(self.fields) - 1)))
+
+    def _set_focus(self, index: int) -> None:
+        """Move focus to `index`, which the caller has already bounded.
+
+        Relies on the invariant established by init(): only the field at
+        focused_index is focused. focused_index itself may be stale if
+        fields were removed, so it is checked before blurring.
+        """
+        if 0 <= self.focused_index < len(self.fields):
+            cur = self.fields[self.focused_index]
+            cur.component.blur()
+            cur._view = None
+        # Focus new
+        self.focused_index = index
+        new = self.fields[index]
+        new.component.focus()
+        new._view = None
 
     def init(self) -> None:
-        """Initialize form — focus first field."""
+        """Initialize form — blur every field, then focus the first."""
         if self.fields:
+            for f in self.fields:
+                f.component.blur()
+                f._view = None
             self.focused_index = 0
             self.fields[0].component.focus()
 
     def next_field(self) -> None:
         """Move focus to next field."""
-        if self.focused_index < len(self.fields) - 1:
-            self.focus_field(self.focused_index + 1)
-        else:
-            self.focus_field(0)
+        if self.fields:
+            self._set_focus((self.focused_index + 1) % len(self.fields))
 
     def prev_field(self) -> None:
         """Move focus to previous field."""
-        if self.focused_index > 0:
-            self.focus_field(self.focused_index - 1)
-        else:
-            self.focus_field(len(self.fields) - 1)
+        if self.fields:
+            self._set_focus((self.focused_index - 1) % len(self.fields))
+
+    def _check_index(self) -> None:
+        """Rebuild the key and value-field indices if self.fields changed."""
+        # One C-level map and list compare; unchanged entries short-circuit
+        sig = list(map(_FIELD_SIG, self.fields))
+        if sig == self._index_sig:
+            return
+        self._index_sig = sig
+        self._key_index = {}
+        self._value_fields = []
+        for i, f in enumerate(self.fields):
+            if hasattr(f.component, 'value'):
+                self._key_index.setdefault(f.key, i)
+                if f.key:
+                    self._value_fields.append(i)
 
     def get_value(self, key: str) -> Any:
         """Get value of a field by key."""
-        for f in self.fields:
-            if f.key == key:
-                comp = f.component
-                if hasattr(comp, 'value'):
-                    return comp.value
-        return None
+        self._check_index()
+        i = self._key_index.get(key)
+        if i is None:
+            return None
+        return self.fields[i].component.value
 
     def get_values(self) -> dict[str, Any]:
         """Get all field values as a dict."""
-        result: dict[str, Any] = {}
-        for f in self.fields:
-            if f.key:
-                comp = f.component
-                if hasattr(comp, 'value'):
-                    result[f.key] = comp.value
-        return result
+        self._check_index()
+        fields = self.fields
+        return {fields[i].key: fields[i].component.value for i in self._value_fields}
 
     def update(self, msg: Msg) -> tuple['Form', Cmd]:
         if self.submitted or self.cancelled:
             return self, None
 
+        # Form-level navigation; every other key goes straight to the field
         if isinstance(msg, KeyMsg):
-            key = msg.key
-
-            # Form-level navigation
-            if key == 'tab':
-                self.next_field()
-                return self, None
-            elif key == 'shift+tab':
-                self.prev_field()
-                return self, None
-            elif key == 'ctrl+c' or key == 'esc':
-                self.cancelled = True
-                return self, None
-            elif key == 'enter':
-                # If on last field, let the component finalize (e.g. Select
-                # sets selected=cursor) then submit
-                if self.focused_index == len(self.fields) - 1:
-                    comp = self.fields[self.focused_index].component
-                    comp, _ = comp.update(msg)
-                    self.fields[self.focused_index].component = comp
-                    self.submitted = True
-                    return self, None
-                # Otherwise move to next field
-                self.next_field()
+            handler = _FORM_KEYS.get(msg.key)
+            if handler is not None:
+                handler(self, msg)
                 return self, None
 
         # Delegate to focused field
         if 0 <= self.focused_index < len(self.fields):
-            comp = self.fields[self.focused_index].component
-            comp, cmd = comp.update(msg)
-            self.fields[self.focused_index].component = comp
+            f = self.fields[self.focused_index]
+            f.component, cmd = f.component.update(msg)
+            f._view = None
             return self, cmd
 
         return self, None
 
+    def _on_next(self, msg: KeyMsg) -> None:
+        self.next_field()
+
+    def _on_prev(self, msg: KeyMsg) -> None:
+        self.prev_field()
+
+    def _on_cancel(self, msg: KeyMsg) -> None:
+        self.cancelled = True
+
+    def _on_enter(self, msg: KeyMsg) -> None:
+        # If on last field, let the component finalize (e.g. Select
+        # sets selected=cursor) then submit
+        if self.focused_index == len(self.fields) - 1:
+            f = self.fields[self.focused_index]
+            f.component, _ = f.component.update(msg)
+            f._view = None
+            self.submitted = True
+            return
+        # Otherwise move to next field
+        self.next_field()
+
     def view(self) -> str:
-        lines: list[str] = []
+        views: list[str] = []
+        theme = self.theme
+        for i, f in enumerate(self.fields):
+            base = None
+            if theme:
+                base = theme.focused_base if i == self.focused_index else theme.blurred_base
+            cached = f._view
+            if cached is not None and cached[0] is base:
+                views.append(cached[1])
+                continue
+            field_view = f.component.view()
+            if base:
+                field_view = base.render(field_view)
+            f._view = (base, field_view)
+            views.append(field_view)
+
+        # Fields are separated by a blank line
+        body = '\n\n'.join(views)
 
         if self._title:
             t = self._title
             if self.title_style:
                 t = self.title_style.render(t)
-            lines.append(t)
-            lines.append('')
+            return t + '\n\n' + body if views else t + '\n'
+        return body
 
-        for i, f in enumerate(self.fields):
-            field_view = f.component.view()
-            if self.theme:
-                is_focused = (i == self.focused_index)
-                base = self.theme.focused_base if is_focused else self.theme.blurred_base
-                if base:
-                    field_view = base.render(field_view)
-            lines.append(field_view)
-            if i < len(self.fields) - 1:
-                lines.append('')  # spacing between fields
-
-        return '\n'.join(lines)
+
+_FORM_KEYS: dict[str, Callable[[Form, KeyMsg], None]] = {
+    'tab': Form._on_next,
+    'shift+tab': Form._on_prev,
+    'ctrl+c': Form._on_cancel,
+    'esc': Form._on_cancel,
+    'enter': Form._on_enter,
+}
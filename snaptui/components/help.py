@@ -10,7 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from ..style import Style
-from .. import strutil
+from ..strutil import cached_visible_width
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,7 +27,7 @@ class KeyBinding:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Help:
     """Renders a set of key bindings in short or full mode.
 
@@ -53,37 +53,36 @@ class Help:
     desc_style: Style = field(default_factory=lambda: Style().dim())
     sep_style: Style = field(default_factory=lambda: Style().dim())
 
+    # (separator, sep_style, rendered separator)
+    _sep_cache: tuple = field(default=(), init=False, repr=False, compare=False)
+
     def short_help(self) -> str:
         """Render a single-line help bar showing enabled bindings."""
         active = [b for b in self.bindings if b.enabled]
         if not active:
             return ""
 
-        sep = self.sep_style.render(self.separator)
+        cache = self._sep_cache
+        if not cache or cache[0] != self.separator or cache[1] is not self.sep_style:
+            cache = self._sep_cache = (self.separator, self.sep_style, self.sep_style.render(self.separator))
+        sep = cache[2]
+        sep_len = len(self.separator)
         gap = " " * self.spacing
         parts: list[str] = []
         total_width = 0
 
         for b in active:
-            key_str = self.key_style.render(b.key)
-            desc_str = self.desc_style.render(b.description)
-            part = f"{key_str}{sep}{desc_str}"
-            part_width = strutil.visible_width(b.key) + len(self.separator) + strutil.visible_width(b.description)
-
+            part_width = cached_visible_width(b.key) + sep_len + cached_visible_width(b.description)
             if parts:
                 part_width += self.spacing
 
             if self.width > 0 and total_width + part_width > self.width:
                 break
 
-            if parts:
-                total_width += self.spacing
-            parts.append(part)
-            total_width += part_width - (self.spacing if parts and len(parts) > 1 else 0)
-            total_width = sum(
-                strutil.visible_width(b2.key) + len(self.separator) + strutil.visible_width(b2.description)
-                for b2 in active[:len(parts)]
-            ) + self.spacing * (len(parts) - 1)
+            total_width += part_width
+            key_str = self.key_style.render(b.key)
+            desc_str = self.desc_style.render(b.description)
+            parts.append(f"{key_str}{sep}{desc_str}")
 
         return gap.join(parts)
 
@@ -94,11 +93,13 @@ class Help:
             return ""
 
         # Find max key width for alignment
-        max_key_w = max(strutil.visible_width(b.key) for b in active)
+        key_widths = [cached_visible_width(b.key) for b in active]
+        max_key_w = max(key_widths)
 
         lines: list[str] = []
-        for b in active:
-            key_str = strutil.pad_right(b.key, max_key_w)
+        for b, kw in zip(active, key_widths):
+            # ljust counts escape bytes, so widen by the invisible length
+            key_str = b.key.ljust(max_key_w + len(b.key) - kw)
             key_styled = self.key_style.render(key_str)
             desc_styled = self.desc_style.render(b.description)
             lines.append(f"  {key_styled}  {desc_styled}")
@@ -5,12 +5,17 @@ Equivalent to bubbles/list + bubbles/paginator.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, ClassVar, Protocol, runtime_checkable
 
 from ..keys import KeyMsg
 from ..model import Cmd
 
+# Key sets for update()
+_KEYS_DOWN = frozenset({'j', 'down'})
+_KEYS_UP = frozenset({'k', 'up'})
+
 
 @runtime_checkable
 class ItemDelegate(Protocol):
@@ -28,15 +33,19 @@ class ItemDelegate(Protocol):
 class _DefaultDelegate:
     """Fallback delegate that renders items via str()."""
 
+    _PREFIX: ClassVar[tuple[str, str]] = ("  ", "> ")
+
     def render(self, item: Any, width: int, selected: bool) -> str:
-        prefix = "> " if selected else "  "
-        return prefix + str(item)
+        return self._PREFIX[selected] + (item if type(item) is str else str(item))
 
     def height(self, item: Any, width: int) -> int:
         return 1
 
 
-@dataclass
+_DEFAULT_DELEGATE = _DefaultDelegate()
+
+
+@dataclass(slots=True)
 class List:
     """Paginated list component with variable-height items."""
 
@@ -48,16 +57,34 @@ class List:
     height: int = 24
     _page_start: int = 0
 
+    # Size of the page at _page_start, valid while _page_key matches
+    _page_size: int = field(default=0, init=False, repr=False, compare=False)
+    _page_key: tuple = field(default=(), init=False, repr=False, compare=False)
+    # delegate.height results by id(item); entries keep the item so a
+    # recycled id can't alias. Valid while _height_key matches
+    _heights: dict[int, tuple[Any, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _height_key: tuple = field(default=(), init=False, repr=False, compare=False)
+    # First item index of every page, valid while _starts_key matches
+    _page_starts: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _starts_key: tuple = field(default=(), init=False, repr=False, compare=False)
+
     def _get_delegate(self) -> ItemDelegate:
-        return self.delegate or _DefaultDelegate()
+        return self.delegate or _DEFAULT_DELEGATE
 
     def set_items(self, items: list) -> None:
         """Replace the item list and clamp cursor."""
         self.items = items
         if self.cursor >= len(items):
             self.cursor = max(0, len(items) - 1)
+        self.refresh()
         self._recalc_page()
 
+    def refresh(self) -> None:
+        """Drop cached pagination (call after editing items in place)."""
+        self._page_key = ()
+        self._starts_key = ()
+        self._heights.clear()
+
     def selected_item(self) -> Any | None:
         """Return the currently selected item, or None if empty."""
         if not self.items or self.cursor < 0 or self.cursor >= len(self.items):
@@ -71,17 +98,25 @@ class List:
             return self, None
 
         key = msg.key
-        if key in ('j', 'down'):
-            if self.cursor < len(self.items) - 1:
-                self.cursor += 1
-                self._recalc_page()
-        elif key in ('k', 'up'):
-            if self.cursor > 0:
-                self.cursor -= 1
-                self._recalc_page()
+        if key in _KEYS_DOWN:
+            self.move(1)
+        elif key in _KEYS_UP:
+            self.move(-1)
 
         return self, None
 
+    def move(self, delta: int) -> None:
+        """Move the cursor by `delta` items, clamped to the list.
+
+        Pagination is recomputed once however far the cursor moves.
+        """
+        if not self.items:
+            return
+        cursor = max(0, min(self.cursor + delta, len(self.items) - 1))
+        if cursor != self.cursor:
+            self.cursor = cursor
+            self._recalc_page()
+
     # ── View ──
 
     def view(self) -> str:
@@ -90,9 +125,13 @@ class List:
             return ""
 
         delegate = self._get_delegate()
+        # Every item on the page is rendered below anyway, so re-measure the
+        # page (item heights are cached) instead of trusting _page_key, which
+        # can't see an item replaced in place
+        self._page_key = ()
         self._recalc_page()
 
-        ps = self._calc_page_size(self._page_start)
+        ps = self._current_page_size()
         page_end = min(self._page_start + ps, len(self.items))
 
         parts: list[str] = []
@@ -111,33 +150,41 @@ class List:
         if not self.items:
             return ""
 
-        pages = 0
-        pos = 0
-        current_page = 1
-        while pos < len(self.items):
-            ps = self._calc_page_size(pos)
-            pages += 1
-            if pos <= self._page_start < pos + ps:
-                current_page = pages
-            pos += ps
-
-        if pages <= 1:
+        starts = self._get_page_starts()
+        if len(starts) <= 1:
             return ""
-        return f"{current_page}/{pages}"
+        return f"{bisect_right(starts, self._page_start)}/{len(starts)}"
 
     # ── Pagination internals ──
 
     def _calc_page_size(self, start: int) -> int:
         """How many items fit on one page starting at `start`."""
-        delegate = self._get_delegate()
         avail = self.height
         if avail <= 0:
             return max(1, len(self.items))
-        total = len(self.items)
+        if self.delegate is None and self.spacing >= 0:
+            # The default delegate renders every item on one line, so the
+            # page size is plain arithmetic
+            per_page = 1 + (avail - 1) // (1 + self.spacing)
+            return max(1, min(per_page, len(self.items) - start))
+        delegate = self._get_delegate()
+        width = self.width
+        if self._height_key != (width, self.delegate):
+            self._heights.clear()
+            self._height_key = (width, self.delegate)
+        heights = self._heights
+        items = self.items
+        total = len(items)
         count = 0
         used = 0
         for i in range(start, total):
-            h = delegate.height(self.items[i], self.width)
+            item = items[i]
+            entry = heights.get(id(item))
+            if entry is not None and entry[0] is item:
+                h = entry[1]
+            else:
+                h = delegate.height(item, width)
+                heights[id(item)] = (item, h)
             # Add spacing between items (not before the first)
             if count > 0:
                 h += self.spacing
@@ -147,6 +194,29 @@ class List:
             count += 1
         return max(1, count)
 
+    def _current_page_size(self) -> int:
+        """_calc_page_size(_page_start), cached until the layout changes."""
+        key = (self._page_start, self.items, len(self.items), self.height,
+               self.width, self.spacing, self.delegate)
+        if key != self._page_key:
+            self._page_size = self._calc_page_size(self._page_start)
+            self._page_key = key
+        return self._page_size
+
+    def _get_page_starts(self) -> list[int]:
+        """Start index of each page, cached until the layout changes."""
+        key = (self.items, len(self.items), self.height, self.width,
+               self.spacing, self.delegate)
+        if key != self._starts_key:
+            starts: list[int] = []
+            pos = 0
+            while pos < len(self.items):
+                starts.append(pos)
+                pos += self._calc_page_size(pos)
+            self._page_starts = starts
+            self._starts_key = key
+        return self._page_starts
+
     def _recalc_page(self) -> None:
         """Ensure _page_start is positioned so cursor is visible."""
         if not self.items:
@@ -155,14 +225,14 @@ class List:
 
         idx = max(0, min(self.cursor, len(self.items) - 1))
 
-        # If cursor is before current page, search forward from 0
+        # Fast path: cursor still on the current page
+        if self._page_start <= idx < self._page_start + self._current_page_size():
+            return
+
+        # If cursor is before current page, jump to the page holding it
         if idx < self._page_start:
-            self._page_start = 0
-            while self._page_start < idx:
-                ps = self._calc_page_size(self._page_start)
-                if self._page_start + ps > idx:
-                    break
-                self._page_start += ps
+            starts = self._get_page_starts()
+            self._page_start = starts[bisect_right(starts, idx) - 1]
 
         # If cursor is past current page, advance page_start
         ps = self._calc_page_size(self._page_start)
@@ -12,7 +12,7 @@ from ..style import Style
 from .. import strutil
 
 
-@dataclass
+@dataclass(slots=True)
 class Progress:
     """Visual progress bar.
 
@@ -35,6 +35,11 @@ class Progress:
     empty_style: Style = field(default_factory=lambda: Style().dim())
     percent_style: Style = field(default_factory=lambda: Style().dim())
 
+    # Rendered bars keyed by (filled, empty, pct_text); valid while _bar_key
+    # (width, chars and styles) matches
+    _bars: dict[tuple[int, int, str], str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _bar_key: tuple = field(default=(), init=False, repr=False, compare=False)
+
     def set_percent(self, percent: float) -> None:
         """Set completion percentage (clamped to 0.0-1.0)."""
         self.percent = max(0.0, min(1.0, percent))
@@ -53,11 +58,18 @@ class Progress:
         filled = round(bar_width * pct)
         empty = bar_width - filled
 
-        fill_str = self.fill_style.render(self.fill_char * filled)
-        empty_str = self.empty_style.render(self.empty_char * empty)
-
-        result = fill_str + empty_str
-        if self.show_percent:
-            result += self.percent_style.render(pct_text)
+        # Styles are immutable builders, so identity is enough to detect a change
+        key = (self.width, self.fill_char, self.empty_char,
+               self.fill_style, self.empty_style, self.percent_style)
+        if key != self._bar_key:
+            self._bars.clear()
+            self._bar_key = key
+        result = self._bars.get((filled, empty, pct_text))
+        if result is None:
+            result = (self.fill_style.render(self.fill_char * filled)
+                      + self.empty_style.render(self.empty_char * empty))
+            if self.show_percent:
+                result += self.percent_style.render(pct_text)
+            self._bars[filled, empty, pct_text] = result
 
         return result
@@ -6,13 +6,14 @@ Equivalent to huh Select / bubbles/list for simple option picking.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 from ..keys import KeyMsg
 from ..model import Cmd, Msg
 from ..style import Style
 
 
-@dataclass
+@dataclass(slots=True)
 class Select:
     """Option picker / dropdown component.
 
@@ -66,26 +67,32 @@ class Select:
         if not self.focused or not isinstance(msg, KeyMsg):
             return self, None
 
-        key = msg.key
-
-        if key in ('up', 'k'):
-            if self.cursor > 0:
-                self.cursor -= 1
-                self._ensure_visible()
-        elif key in ('down', 'j'):
-            if self.cursor < len(self.options) - 1:
-                self.cursor += 1
-                self._ensure_visible()
-        elif key in ('enter', 'space'):
-            self.selected = self.cursor
-        elif key == 'home':
-            self.cursor = 0
+        handler = _KEY_HANDLERS.get(msg.key)
+        if handler is not None:
+            handler(self)
+
+        return self, None
+
+    def _cursor_up(self) -> None:
+        if self.cursor > 0:
+            self.cursor -= 1
             self._ensure_visible()
-        elif key == 'end':
-            self.cursor = len(self.options) - 1
+
+    def _cursor_down(self) -> None:
+        if self.cursor < len(self.options) - 1:
+            self.cursor += 1
             self._ensure_visible()
 
-        return self, None
+    def _select_cursor(self) -> None:
+        self.selected = self.cursor
+
+    def _goto_first(self) -> None:
+        self.cursor = 0
+        self._ensure_visible()
+
+    def _goto_last(self) -> None:
+        self.cursor = len(self.options) - 1
+        self._ensure_visible()
 
     def _ensure_visible(self) -> None:
         """Ensure cursor is within visible range."""
@@ -109,24 +116,33 @@ class Select:
         start = self._offset
         end = len(self.options) if self.height <= 0 else min(start + self.height, len(self.options))
 
+        # Resolve row renderers once; unstyled rows pass through str()
+        plain = str
+        cursor_render = self.cursor_style.render if self.cursor_style else plain
+        selected_render = self.selected_style.render if self.selected_style else plain
+        normal_render = self.normal_style.render if self.normal_style else plain
+        cursor = self.cursor if self.focused else -1
+        selected = self.selected
+
+        options = self.options
         for i in range(start, end):
-            opt = self.options[i]
-            is_cursor = i == self.cursor and self.focused
-            is_selected = i == self.selected
-
-            if is_cursor:
-                prefix = '> '
-                style = self.cursor_style
-            elif is_selected:
-                prefix = '> '
-                style = self.selected_style
+            if i == cursor:
+                lines.append(cursor_render('> ' + options[i]))
+            elif i == selected:
+                lines.append(selected_render('> ' + options[i]))
             else:
-                prefix = '  '
-                style = self.normal_style
-
-            text = prefix + opt
-            if style:
-                text = style.render(text)
-            lines.append(text)
+                lines.append(normal_render('  ' + options[i]))
 
         return '\n'.join(lines)
+
+
+_KEY_HANDLERS: dict[str, Callable[[Select], None]] = {
+    'up': Select._cursor_up,
+    'k': Select._cursor_up,
+    'down': Select._cursor_down,
+    'j': Select._cursor_down,
+    'enter': Select._select_cursor,
+    'space': Select._select_cursor,
+    'home': Select._goto_first,
+    'end': Select._goto_last,
+}
@@ -6,11 +6,11 @@ architecture command loop.
 
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass, field
 from typing import Any
 
-from ..model import Cmd, Msg
+from ..model import Cmd, Msg, TickCmd
+from ..style import Style
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,6 +19,17 @@ class SpinnerTickMsg:
     tag: int = 0
 
 
+# One message per tag: SpinnerTickMsg is frozen, so ticks can share it
+_TICK_MSGS: dict[int, SpinnerTickMsg] = {}
+
+
+def _tick_msg(tag: int) -> SpinnerTickMsg:
+    msg = _TICK_MSGS.get(tag)
+    if msg is None:
+        msg = _TICK_MSGS[tag] = SpinnerTickMsg(tag=tag)
+    return msg
+
+
 # ── Built-in spinner styles ──
 
 SPINNER_LINE = ["|", "/", "-", "\\"]
@@ -31,7 +42,7 @@ SPINNER_METER = ["▱▱▱", "▰▱▱", "▰▰▱", "▰▰▰", "▰▰▱"
 SPINNER_MINI_DOT = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Spinner:
     """Animated spinner component.
 
@@ -45,32 +56,47 @@ class Spinner:
         fps: Frames per second (controls tick interval).
         frame: Current frame index.
         tag: Unique tag to distinguish multiple spinners.
+        style: Optional style applied to each frame.
     """
     frames: list[str] = field(default_factory=lambda: list(SPINNER_DOTS))
     fps: float = 10.0
     frame: int = 0
     tag: int = 0
+    style: Style | None = None
 
-    def tick(self) -> Cmd:
-        """Return a command that sleeps then sends a SpinnerTickMsg."""
-        interval = 1.0 / self.fps if self.fps > 0 else 0.1
-        tag = self.tag
+    # Frames with style applied, rendered once; valid while _rendered_key
+    # (frames list, its length, style) matches. Call refresh() after editing
+    # frames in place.
+    _rendered: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _rendered_key: tuple = field(default=(), init=False, repr=False, compare=False)
 
-        def _tick() -> SpinnerTickMsg:
-            time.sleep(interval)
-            return SpinnerTickMsg(tag=tag)
+    def refresh(self) -> None:
+        """Drop the rendered frames after editing ``frames`` in place."""
+        self._rendered_key = ()
 
-        return _tick
+    def tick(self) -> Cmd:
+        """Return a command that sends a SpinnerTickMsg after one frame."""
+        interval = 1.0 / self.fps if self.fps > 0 else 0.1
+        return TickCmd(interval, _tick_msg(self.tag))
 
     def update(self, msg: Msg) -> tuple['Spinner', Cmd]:
         """Handle SpinnerTickMsg to advance the frame."""
         if isinstance(msg, SpinnerTickMsg) and msg.tag == self.tag:
-            self.frame = (self.frame + 1) % len(self.frames)
+            # With no frames there is nothing to advance (and no modulus)
+            n = len(self.frames)
+            if n:
+                self.frame = (self.frame + 1) % n
             return self, self.tick()
         return self, None
 
     def view(self) -> str:
         """Render the current spinner frame."""
-        if not self.frames:
+        frames = self.frames
+        key = self._rendered_key
+        if not key or key[0] is not frames or key[1] != len(frames) or key[2] is not self.style:
+            style = self.style
+            self._rendered = [style.render(f) for f in frames] if style else list(frames)
+            self._rendered_key = key = (frames, len(frames), style)
+        if not key[1]:
             return ""
-        return self.frames[self.frame % len(self.frames)]
+        return self._rendered[self.frame % key[1]]
@@ -7,11 +7,31 @@ optional headers, row selection, and scrolling.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import zip_longest
 
 from ..keys import KeyMsg
 from ..model import Cmd, Msg
 from ..style import Style
 from .. import strutil
+from ..strutil import cached_visible_width
+
+# Cell strings repeat on every redraw; memoize their fitting
+_fit_width = lru_cache(maxsize=8192)(strutil.fit_width)
+
+# Key sets for update()
+_KEYS_DOWN = frozenset({'j', 'down'})
+_KEYS_UP = frozenset({'k', 'up'})
+
+
+def _widen(fit: list[int], rows: list[list[str]]) -> None:
+    """Raise each entry of fit to the widest cell in that column of rows."""
+    # Transposed, each column's maximum is one C-level max(map(...)); short
+    # rows are filled with '' (width 0) and cells past len(fit) are ignored
+    for i, cells in zip(range(len(fit)), zip_longest(*rows, fillvalue='')):
+        w = max(map(cached_visible_width, cells))
+        if w > fit[i]:
+            fit[i] = w
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,7 +46,7 @@ class Column:
     width: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Column-aligned data table with optional selection and scrolling.
 
@@ -37,6 +57,9 @@ class Table:
         height: Max visible rows (0 = show all).
         y_offset: Scroll offset for tall tables.
         focused: Whether the table accepts keyboard input.
+        fit_visible: Auto-fit columns to the visible rows only (when height
+            is set) instead of all rows. Cheaper for huge tables, but
+            column widths can change as the table scrolls.
         header_style: Style for the header row.
         selected_style: Style for the selected row.
         cell_style: Style for normal cells.
@@ -47,24 +70,61 @@ class Table:
     height: int = 0
     y_offset: int = 0
     focused: bool = False
+    fit_visible: bool = False
     header_style: Style = field(default_factory=lambda: Style().bold())
     selected_style: Style = field(default_factory=lambda: Style().reverse())
     cell_style: Style = field(default_factory=Style)
 
+    # Auto-fit cache: max of header and cell widths per column, for the
+    # columns in _fit_cols and the rows copied into _fit_snap. Comparing
+    # rows against the copies catches cells edited or rows replaced in place
+    _fit: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _fit_snap: list[list[str]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _fit_cols: tuple[Column, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    # (key, [styled header, separator]) for the lines above the rows
+    _chrome: tuple = field(default=(), init=False, repr=False, compare=False)
+
     def _col_widths(self) -> list[int]:
         """Compute effective column widths."""
-        widths: list[int] = []
-        for i, col in enumerate(self.columns):
-            if col.width > 0:
-                widths.append(col.width)
-            else:
-                # Auto-fit: max of header and all row values
-                w = strutil.visible_width(col.title)
-                for row in self.rows:
-                    if i < len(row):
-                        w = max(w, strutil.visible_width(row[i]))
-                widths.append(w)
-        return widths
+        rows = self.rows
+        cols = tuple(self.columns)
+        if self.fit_visible and 0 < self.height < len(rows):
+            return self._visible_col_widths(cols)
+        snap = self._fit_snap
+        n = len(snap)
+        # One C-level list compare; identical cell strings short-circuit
+        if cols != self._fit_cols or len(rows) < n or rows[:n] != snap:
+            self._fit = [cached_visible_width(col.title) for col in cols]
+            self._fit_cols = cols
+            snap.clear()
+            n = 0
+
+        # Rows appended since the last call only widen the columns
+        if len(rows) > n:
+            new = rows[n:]
+            _widen(self._fit, new)
+            snap.extend([row[:] for row in new])
+
+        return [col.width if col.width > 0 else w for col, w in zip(cols, self._fit)]
+
+    def _visible_col_widths(self, cols: tuple[Column, ...]) -> list[int]:
+        """Column widths fitted to the rows currently scrolled into view."""
+        fit = [cached_visible_width(col.title) for col in cols]
+        _widen(fit, self.rows[self.y_offset:self.y_offset + self.height])
+        return [col.width if col.width > 0 else w for col, w in zip(cols, fit)]
+
+    def set_rows(self, rows: list[list[str]]) -> None:
+        """Replace all rows."""
+        self.rows = rows
+        self.refresh()
+
+    def append_row(self, row: list[str]) -> None:
+        """Add a row at the end; column widths are updated incrementally."""
+        self.rows.append(row)
+
+    def refresh(self) -> None:
+        """Drop cached column widths so the next view() re-measures every row."""
+        self._fit_cols = None
 
     def selected_row(self) -> list[str] | None:
         """Return the currently selected row, or None."""
@@ -85,17 +145,27 @@ class Table:
             return self, None
 
         key = msg.key
-        if key in ('j', 'down'):
-            if self.cursor < len(self.rows) - 1:
-                self.cursor += 1
-                self._ensure_visible()
-        elif key in ('k', 'up'):
-            if self.cursor > 0:
-                self.cursor -= 1
-                self._ensure_visible()
+        if key in _KEYS_DOWN:
+            self.move(1)
+        elif key in _KEYS_UP:
+            self.move(-1)
 
         return self, None
 
+    def move(self, delta: int) -> None:
+        """Move the cursor by `delta` rows, clamped to the table.
+
+        Scrolls once however far the cursor moves. With no selection
+        (cursor -1), moving up is ignored and moving down selects rows
+        counting from the first.
+        """
+        if not self.rows or (delta < 0 and self.cursor < 0):
+            return
+        cursor = max(0, min(self.cursor + delta, len(self.rows) - 1))
+        if cursor != self.cursor:
+            self.cursor = cursor
+            self._ensure_visible()
+
     def _ensure_visible(self) -> None:
         """Scroll so cursor is visible."""
         if self.height <= 0:
@@ -112,19 +182,16 @@ class Table:
         widths = self._col_widths()
         gap = "  "
 
-        lines: list[str] = []
-
-        # Header
-        header_cells: list[str] = []
-        for i, col in enumerate(self.columns):
-            cell = strutil.pad_right(col.title, widths[i])
-            header_cells.append(cell)
-        header_line = gap.join(header_cells)
-        lines.append(self.header_style.render(header_line))
-
-        # Separator
-        sep_parts = ["\u2500" * w for w in widths]
-        lines.append(gap.join(sep_parts))
+        # Header and separator only change with the columns, widths or style
+        key = (widths, tuple(self.columns), self.header_style)
+        if not self._chrome or self._chrome[0] != key:
+            header_line = gap.join(
+                col.title.ljust(w + len(col.title) - cached_visible_width(col.title))
+                for col, w in zip(self.columns, widths)
+            )
+            sep_line = gap.join(["\u2500" * w for w in widths])
+            self._chrome = (key, [self.header_style.render(header_line), sep_line])
+        lines: list[str] = list(self._chrome[1])
 
         # Rows (with scrolling)
         visible_rows = self.rows
@@ -133,14 +200,13 @@ class Table:
             start = self.y_offset
             visible_rows = self.rows[start:start + self.height]
 
+        ncols = len(widths)
         for row_idx, row in enumerate(visible_rows):
             actual_idx = start + row_idx
-            cells: list[str] = []
-            for i in range(len(self.columns)):
-                val = row[i] if i < len(row) else ""
-                cell = strutil.pad_right(strutil.truncate(val, widths[i]), widths[i])
-                cells.append(cell)
-            line = gap.join(cells)
+            # map() stops at the shorter input; pad short rows with blanks
+            if len(row) < ncols:
+                row = list(row) + [""] * (ncols - len(row))
+            line = gap.join(map(_fit_width, row, widths))
             if actual_idx == self.cursor:
                 lines.append(self.selected_style.render(line))
             else:
@@ -6,14 +6,19 @@ Equivalent to bubbles/textarea. Used for note editing.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 from .. import strutil
-from ..keys import KeyMsg
+from ..keys import KeyMsg, PasteMsg
 from ..model import Cmd, Msg
 from ..style import Style
 
+_DEFAULT_CURSOR = Style().reverse()
 
-@dataclass
+
+# init=False: ``lines`` is a property over the gap buffer, so the
+# constructor is written out below
+@dataclass(slots=True, init=False)
 class TextArea:
     """Multi-line text editor.
 
@@ -26,21 +31,123 @@ class TextArea:
         height: Display height (visible lines)
         y_offset: Scroll offset
     """
-    lines: list[str] = field(default_factory=lambda: [''])
-    cursor_row: int = 0
-    cursor_col: int = 0
-    focused: bool = False
-    width: int = 80
-    height: int = 20
-    y_offset: int = 0
-    _label: str = ''
-    show_line_numbers: bool = False
-    char_limit: int = 0  # 0 = unlimited
+    cursor_row: int
+    cursor_col: int
+    focused: bool
+    width: int
+    height: int
+    y_offset: int
+    _label: str
+    show_line_numbers: bool
+    char_limit: int  # 0 = unlimited
 
     # Styles
-    cursor_style: Style | None = None
-    line_number_style: Style | None = None
-    focused_line_style: Style | None = None
+    cursor_style: Style | None
+    line_number_style: Style | None
+    focused_line_style: Style | None
+
+    # Rendered rows (gutter + truncated content) from the last frame, keyed
+    # by (row, line text); valid while _row_cache_key matches
+    _row_cache: dict[tuple[int, str], str] = field(repr=False, compare=False)
+    _row_cache_key: tuple = field(repr=False, compare=False)
+
+    # Gap buffer over the row being typed into: text before the cursor, and
+    # text after it stored reversed, so character edits are list append/pop.
+    # _lines[_gap_row] holds the string the buffer was opened from (or last
+    # synced to); ``lines`` is a property that syncs before handing it out.
+    _lines: list[str] = field(repr=False, compare=False)
+    _gap_row: int = field(repr=False, compare=False)
+    _gap_text: str = field(repr=False, compare=False)
+    _gap_dirty: bool = field(repr=False, compare=False)
+    _left: list[str] = field(repr=False, compare=False)
+    _right: list[str] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        lines: list[str] | None = None,
+        cursor_row: int = 0,
+        cursor_col: int = 0,
+        focused: bool = False,
+        width: int = 80,
+        height: int = 20,
+        y_offset: int = 0,
+        _label: str = '',
+        show_line_numbers: bool = False,
+        char_limit: int = 0,
+        cursor_style: Style | None = None,
+        line_number_style: Style | None = None,
+        focused_line_style: Style | None = None,
+    ) -> None:
+        self._lines = [''] if lines is None else lines
+        self.cursor_row = cursor_row
+        self.cursor_col = cursor_col
+        self.focused = focused
+        self.width = width
+        self.height = height
+        self.y_offset = y_offset
+        self._label = _label
+        self.show_line_numbers = show_line_numbers
+        self.char_limit = char_limit
+        self.cursor_style = cursor_style
+        self.line_number_style = line_number_style
+        self.focused_line_style = focused_line_style
+        self._row_cache = {}
+        self._row_cache_key = ()
+        self._gap_row = -1
+        self._gap_text = ''
+        self._gap_dirty = False
+        self._left = []
+        self._right = []
+
+    @property
+    def lines(self) -> list[str]:
+        self._sync()
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines: list[str]) -> None:
+        self._lines = lines
+        self._gap_row = -1
+        self._gap_dirty = False
+        # The new line under the cursor may be shorter than the old one
+        if self.cursor_row < len(lines):
+            self._clamp_col()
+
+    def _sync(self) -> None:
+        """Write pending gap-buffer edits back into _lines."""
+        if self._gap_dirty:
+            self._gap_dirty = False
+            row = self._gap_row
+            if row < len(self._lines) and self._lines[row] is self._gap_text:
+                text = ''.join(self._left) + ''.join(reversed(self._right))
+                self._lines[row] = self._gap_text = text
+
+    def _gap_at_cursor(self) -> tuple[list[str], list[str]]:
+        """Open (or move) the gap buffer at the cursor; returns (left, right)."""
+        row = self.cursor_row
+        line = self._lines[row]
+        if row != self._gap_row or line is not self._gap_text:
+            # New row, or the line was replaced from outside: reopen
+            self._sync()
+            col = self.cursor_col = min(self.cursor_col, len(line))
+            self._left = list(line[:col])
+            self._right = list(reversed(line[col:]))
+            self._gap_row = row
+            self._gap_text = line
+            return self._left, self._right
+        left, right = self._left, self._right
+        col = self.cursor_col = min(self.cursor_col, len(left) + len(right))
+        while len(left) > col:
+            right.append(left.pop())
+        while len(left) < col:
+            left.append(right.pop())
+        return left, right
+
+    def _insert(self, text: str) -> None:
+        left, _ = self._gap_at_cursor()
+        left.extend(text)
+        self._gap_dirty = True
+        self.cursor_col += len(text)
 
     def label(self, text: str) -> 'TextArea':
         self._label = text
@@ -55,7 +162,8 @@ class TextArea:
     @property
     def value(self) -> str:
         """Return full text content."""
-        return '\n'.join(self.lines)
+        self._sync()
+        return '\n'.join(self._lines)
 
     def set_value(self, text: str) -> None:
         """Set text content."""
@@ -73,112 +181,165 @@ class TextArea:
 
     def _clamp_col(self) -> None:
         """Ensure cursor column is within current line bounds."""
-        max_col = len(self.lines[self.cursor_row])
+        max_col = len(self._lines[self.cursor_row])
         self.cursor_col = min(self.cursor_col, max_col)
 
+    def paste(self, text: str) -> None:
+        """Insert text at the cursor in one splice, splitting on newlines.
+
+        Tabs become four spaces; other unprintable characters are dropped.
+        """
+        text = text.replace('\r\n', '\n').replace('\r', '\n').replace('\t', '    ')
+        if not text.replace('\n', '').isprintable():
+            text = ''.join(ch for ch in text if ch == '\n' or ch.isprintable())
+        if '\n' not in text:
+            self._insert(text)
+            return
+        self._sync()
+        row = self.cursor_row
+        line = self._lines[row]
+        col = min(self.cursor_col, len(line))
+        parts = text.split('\n')
+        parts[0] = line[:col] + parts[0]
+        last = parts[-1]
+        parts[-1] = last + line[col:]
+        self._lines[row:row + 1] = parts
+        self.cursor_row = row + len(parts) - 1
+        self.cursor_col = len(last)
+        self._ensure_cursor_visible()
+
     def update(self, msg: Msg) -> tuple['TextArea', Cmd]:
-        if not self.focused or not isinstance(msg, KeyMsg):
+        if not self.focused:
+            return self, None
+        if isinstance(msg, PasteMsg):
+            self.paste(msg.text)
             return self, None
+        if not isinstance(msg, KeyMsg):
+            return self, None
+
+        handler = _KEY_HANDLERS.get(msg.key)
+        if handler is not None:
+            handler(self)
+        else:
+            ch = msg.char
+            # Printable ASCII is a range check; only non-ASCII hits isprintable()
+            if len(ch) == 1 and (' ' <= ch <= '~' or ch.isprintable()):
+                self._insert(ch)
 
-        key = msg.key
-
-        # Navigation
-        if key == 'up':
-            if self.cursor_row > 0:
-                self.cursor_row -= 1
-                self._clamp_col()
-                self._ensure_cursor_visible()
-        elif key == 'down':
-            if self.cursor_row < len(self.lines) - 1:
-                self.cursor_row += 1
-                self._clamp_col()
-                self._ensure_cursor_visible()
-        elif key == 'left':
-            if self.cursor_col > 0:
+        return self, None
+
+    # ── Key handlers (dispatched via _KEY_HANDLERS) ──
+    # Character edits at the cursor go through the gap buffer; everything
+    # else syncs it and works on whole lines.
+
+    def _insert_space(self) -> None:
+        self._insert(' ')
+
+    def _insert_tab(self) -> None:
+        # Insert spaces for tab
+        self._insert('    ')
+
+    def _backspace(self) -> None:
+        if self.cursor_col > 0:
+            # _gap_at_cursor clamps cursor_col to the line, which may leave
+            # nothing to delete if the line was shortened from outside
+            left, _ = self._gap_at_cursor()
+            if left:
+                left.pop()
+                self._gap_dirty = True
                 self.cursor_col -= 1
-            elif self.cursor_row > 0:
-                self.cursor_row -= 1
-                self.cursor_col = len(self.lines[self.cursor_row])
-                self._ensure_cursor_visible()
-        elif key == 'right':
-            if self.cursor_col < len(self.lines[self.cursor_row]):
-                self.cursor_col += 1
-            elif self.cursor_row < len(self.lines) - 1:
-                self.cursor_row += 1
-                self.cursor_col = 0
-                self._ensure_cursor_visible()
-        elif key == 'home' or key == 'ctrl+a':
-            self.cursor_col = 0
-        elif key == 'end' or key == 'ctrl+e':
-            self.cursor_col = len(self.lines[self.cursor_row])
-
-        # Editing
-        elif key == 'enter':
-            # Split line at cursor
-            line = self.lines[self.cursor_row]
-            before = line[:self.cursor_col]
-            after = line[self.cursor_col:]
-            self.lines[self.cursor_row] = before
-            self.lines.insert(self.cursor_row + 1, after)
-            self.cursor_row += 1
-            self.cursor_col = 0
+            return
+        self._sync()
+        if self.cursor_row > 0:
+            # Merge with previous line
+            prev_len = len(self._lines[self.cursor_row - 1])
+            self._lines[self.cursor_row - 1] += self._lines[self.cursor_row]
+            self._lines.pop(self.cursor_row)
+            self.cursor_row -= 1
+            self.cursor_col = prev_len
             self._ensure_cursor_visible()
-        elif key == 'backspace':
-            if self.cursor_col > 0:
-                line = self.lines[self.cursor_row]
-                self.lines[self.cursor_row] = line[:self.cursor_col - 1] + line[self.cursor_col:]
-                self.cursor_col -= 1
-            elif self.cursor_row > 0:
-                # Merge with previous line
-                prev_len = len(self.lines[self.cursor_row - 1])
-                self.lines[self.cursor_row - 1] += self.lines[self.cursor_row]
-                self.lines.pop(self.cursor_row)
-                self.cursor_row -= 1
-                self.cursor_col = prev_len
-                self._ensure_cursor_visible()
-        elif key == 'delete':
-            line = self.lines[self.cursor_row]
-            if self.cursor_col < len(line):
-                self.lines[self.cursor_row] = line[:self.cursor_col] + line[self.cursor_col + 1:]
-            elif self.cursor_row < len(self.lines) - 1:
-                # Merge with next line
-                self.lines[self.cursor_row] += self.lines[self.cursor_row + 1]
-                self.lines.pop(self.cursor_row + 1)
-        elif key == 'ctrl+k':
-            # Kill to end of line
-            self.lines[self.cursor_row] = self.lines[self.cursor_row][:self.cursor_col]
-        elif key == 'tab':
-            # Insert spaces for tab
-            self.lines[self.cursor_row] = (
-                self.lines[self.cursor_row][:self.cursor_col]
-                + '    '
-                + self.lines[self.cursor_row][self.cursor_col:]
-            )
-            self.cursor_col += 4
-
-        # Character input
-        elif msg.char and len(msg.char) == 1 and msg.char.isprintable():
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = line[:self.cursor_col] + msg.char + line[self.cursor_col:]
-            self.cursor_col += 1
-        elif key == 'space':
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = line[:self.cursor_col] + ' ' + line[self.cursor_col:]
-            self.cursor_col += 1
 
-        # Page navigation
-        elif key == 'pgup':
-            self.cursor_row = max(0, self.cursor_row - self.height)
+    def _delete(self) -> None:
+        _, right = self._gap_at_cursor()
+        if right:
+            right.pop()
+            self._gap_dirty = True
+            return
+        self._sync()
+        if self.cursor_row < len(self._lines) - 1:
+            # Merge with next line
+            self._lines[self.cursor_row] += self._lines[self.cursor_row + 1]
+            self._lines.pop(self.cursor_row + 1)
+
+    def _cursor_up(self) -> None:
+        self._sync()
+        if self.cursor_row > 0:
+            self.cursor_row -= 1
             self._clamp_col()
             self._ensure_cursor_visible()
-        elif key == 'pgdown':
-            self.cursor_row = min(len(self.lines) - 1, self.cursor_row + self.height)
+
+    def _cursor_down(self) -> None:
+        self._sync()
+        if self.cursor_row < len(self._lines) - 1:
+            self.cursor_row += 1
             self._clamp_col()
             self._ensure_cursor_visible()
 
-        return self, None
+    def _cursor_left(self) -> None:
+        self._sync()
+        if self.cursor_col > 0:
+            self.cursor_col -= 1
+        elif self.cursor_row > 0:
+            self.cursor_row -= 1
+            self.cursor_col = len(self._lines[self.cursor_row])
+            self._ensure_cursor_visible()
+
+    def _cursor_right(self) -> None:
+        self._sync()
+        if self.cursor_col < len(self._lines[self.cursor_row]):
+            self.cursor_col += 1
+        elif self.cursor_row < len(self._lines) - 1:
+            self.cursor_row += 1
+            self.cursor_col = 0
+            self._ensure_cursor_visible()
+
+    def _cursor_start(self) -> None:
+        self.cursor_col = 0
+
+    def _cursor_end(self) -> None:
+        self._sync()
+        self.cursor_col = len(self._lines[self.cursor_row])
+
+    def _newline(self) -> None:
+        # Split line at cursor
+        self._sync()
+        line = self._lines[self.cursor_row]
+        before = line[:self.cursor_col]
+        after = line[self.cursor_col:]
+        self._lines[self.cursor_row] = before
+        self._lines.insert(self.cursor_row + 1, after)
+        self.cursor_row += 1
+        self.cursor_col = 0
+        self._ensure_cursor_visible()
+
+    def _kill_to_end(self) -> None:
+        self._sync()
+        self._lines[self.cursor_row] = self._lines[self.cursor_row][:self.cursor_col]
+
+    def _page_up(self) -> None:
+        self._sync()
+        self.cursor_row = max(0, self.cursor_row - self.height)
+        self._clamp_col()
+        self._ensure_cursor_visible()
+
+    def _page_down(self) -> None:
+        self._sync()
+        self.cursor_row = min(len(self._lines) - 1, self.cursor_row + self.height)
+        self._clamp_col()
+        self._ensure_cursor_visible()
 
     def view(self) -> str:
+        self._sync()
         result: list[str] = []
 
         if self._label:
@@ -187,16 +348,29 @@ class TextArea:
         # Line number gutter width
         gutter_w = 0
         if self.show_line_numbers:
-            gutter_w = len(str(len(self.lines))) + 1  # e.g. "  3 "
+            gutter_w = len(str(len(self._lines))) + 1  # e.g. "  3 "
 
         content_w = self.width - gutter_w
 
         # Visible range
         start = self.y_offset
-        end = min(start + self.height, len(self.lines))
+        end = min(start + self.height, len(self._lines))
+
+        # Rows other than the cursor row rarely change between keystrokes;
+        # reuse last frame's rendering for the ones whose text is unchanged
+        cache_key = (content_w, gutter_w, self.line_number_style)
+        old_cache = self._row_cache if cache_key == self._row_cache_key else {}
+        new_cache: dict[tuple[int, str], str] = {}
+        cursor_row = self.cursor_row if self.focused else -1
 
         for i in range(start, end):
-            line = self.lines[i]
+            line = self._lines[i]
+            if i != cursor_row:
+                row = old_cache.get((i, line))
+                if row is not None:
+                    new_cache[i, line] = row
+                    result.append(row)
+                    continue
 
             # Line number
             gutter = ''
@@ -208,24 +382,32 @@ class TextArea:
 
             # Content with cursor
             display = line
-            if self.focused and i == self.cursor_row:
+            if i == cursor_row:
                 # Show cursor
                 col = min(self.cursor_col, len(display))
                 before = display[:col]
                 after = display[col:]
                 cursor_char = after[0] if after else ' '
                 after = after[1:] if after else ''
-                cs = self.cursor_style or Style().reverse()
+                cs = self.cursor_style or _DEFAULT_CURSOR
                 display = before + cs.render(cursor_char) + after
 
             # Truncate to content width
             display = strutil.truncate(display, content_w)
 
-            result.append(gutter + display)
+            row = gutter + display
+            if i != cursor_row:
+                new_cache[i, line] = row
+            result.append(row)
+
+        self._row_cache = new_cache
+        self._row_cache_key = cache_key
 
         # Pad remaining height
-        while len(result) - (1 if self._label else 0) < self.height:
-            result.append(' ' * gutter_w if self.show_line_numbers else '')
+        n_rendered = end - start
+        if n_rendered < self.height:
+            pad = ' ' * gutter_w if self.show_line_numbers else ''
+            result.extend([pad] * (self.height - max(n_rendered, 0)))
 
         return '\n'.join(result)
 
@@ -245,6 +427,26 @@ class TextArea:
             row += 1
         col = self.cursor_col
         if self.show_line_numbers:
-            gutter_w = len(str(len(self.lines))) + 1
+            gutter_w = len(str(len(self._lines))) + 1
             col += gutter_w
         return (row, col)
+
+
+_KEY_HANDLERS: dict[str, Callable[[TextArea], None]] = {
+    'up': TextArea._cursor_up,
+    'down': TextArea._cursor_down,
+    'left': TextArea._cursor_left,
+    'right': TextArea._cursor_right,
+    'home': TextArea._cursor_start,
+    'ctrl+a': TextArea._cursor_start,
+    'end': TextArea._cursor_end,
+    'ctrl+e': TextArea._cursor_end,
+    'enter': TextArea._newline,
+    'backspace': TextArea._backspace,
+    'delete': TextArea._delete,
+    'ctrl+k': TextArea._kill_to_end,
+    'pgup': TextArea._page_up,
+    'pgdown': TextArea._page_down,
+    'space': TextArea._insert_space,
+    'tab': TextArea._insert_tab,
+}
@@ -5,15 +5,26 @@ Equivalent to huh Input / bubbles/textinput.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+from typing import Callable
 
 from .. import strutil
-from ..keys import KeyMsg
-from ..model import Cmd, CursorBlinkMsg, Msg
+from ..keys import KeyMsg, PasteMsg
+from ..model import Cmd, CursorBlinkMsg, Msg, TickCmd
 from ..style import Style
 
+_DEFAULT_CURSOR = Style().reverse()
+_BLINK_INTERVAL = 0.53
+# Single-line input: pasted line breaks and tabs become spaces
+_PASTE_SPACES = str.maketrans('\r\n\t', '   ')
+# Slots in TextInput._styled_cache
+_LABEL, _PROMPT, _PLACEHOLDER = range(3)
 
-@dataclass
+
+# init=False: ``value`` and ``cursor`` are properties over the gap buffer,
+# so the constructor is written out below
+@dataclass(slots=True, init=False)
 class TextInput:
     """Single-line text input with cursor.
 
@@ -26,27 +37,105 @@ class TextInput:
         width: Maximum display width
         char_limit: Maximum character count (0 = unlimited)
     """
-    value: str = ''
-    placeholder: str = ''
-    prompt: str = '> '
-    cursor: int = 0
-    focused: bool = False
-    width: int = 40
-    char_limit: int = 0
-    _label: str = ''
+    placeholder: str
+    prompt: str
+    focused: bool
+    width: int
+    char_limit: int
+    _label: str
 
     # Styles (configurable)
-    label_style: Style | None = None
-    prompt_style: Style | None = None
-    text_style: Style | None = None
-    placeholder_style: Style | None = None
-    cursor_style: Style | None = None
+    label_style: Style | None
+    prompt_style: Style | None
+    text_style: Style | None
+    placeholder_style: Style | None
+    cursor_style: Style | None
 
     # Cursor blink
-    cursor_blink: bool = False
-    _cursor_visible: bool = True
-    _blink_tag: int = 0
-    _blink_active: bool = False
+    cursor_blink: bool
+    _cursor_visible: bool
+    _blink_tag: int
+    _blink_active: bool
+    # Typing keeps the cursor solid until this time.monotonic() deadline;
+    # the in-flight blink tick reschedules itself instead of toggling
+    _blink_hold: float
+
+    # Gap buffer: text before the cursor, and text after the cursor stored
+    # reversed, so edits at the cursor are list append/pop rather than
+    # string splices. Together they stand in for ``value`` and ``cursor``
+    # when comparing inputs.
+    _left: list[str] = field(repr=False)
+    _right: list[str] = field(repr=False)
+    _value: str | None = field(repr=False, compare=False)
+    _cursor_rev: tuple[Style, Style] | None = field(repr=False, compare=False)
+    # (text, style, rendered) for the label, prompt and placeholder slots
+    _styled_cache: list[tuple[str, Style, str] | None] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        value: str = '',
+        placeholder: str = '',
+        prompt: str = '> ',
+        cursor: int = 0,
+        focused: bool = False,
+        width: int = 40,
+        char_limit: int = 0,
+        _label: str = '',
+        label_style: Style | None = None,
+        prompt_style: Style | None = None,
+        text_style: Style | None = None,
+        placeholder_style: Style | None = None,
+        cursor_style: Style | None = None,
+        cursor_blink: bool = False,
+    ) -> None:
+        cursor = max(0, min(cursor, len(value)))
+        self._left = list(value[:cursor])
+        self._right = list(reversed(value[cursor:]))
+        self._value = value
+        self.placeholder = placeholder
+        self.prompt = prompt
+        self.focused = focused
+        self.width = width
+        self.char_limit = char_limit
+        self._label = _label
+        self.label_style = label_style
+        self.prompt_style = prompt_style
+        self.text_style = text_style
+        self.placeholder_style = placeholder_style
+        self.cursor_style = cursor_style
+        self.cursor_blink = cursor_blink
+        self._cursor_visible = True
+        self._blink_tag = 0
+        self._blink_active = False
+        self._blink_hold = 0.0
+        self._cursor_rev = None
+        self._styled_cache = [None, None, None]
+
+    @property
+    def value(self) -> str:
+        if self._value is None:
+            self._value = ''.join(self._left) + ''.join(reversed(self._right))
+        return self._value
+
+    @value.setter
+    def value(self, v: str) -> None:
+        pos = min(len(self._left), len(v))
+        self._left = list(v[:pos])
+        self._right = list(reversed(v[pos:]))
+        self._value = v
+
+    @property
+    def cursor(self) -> int:
+        return len(self._left)
+
+    @cursor.setter
+    def cursor(self, pos: int) -> None:
+        left, right = self._left, self._right
+        pos = max(0, min(pos, len(left) + len(right)))
+        while len(left) > pos:
+            right.append(left.pop())
+        while len(left) < pos:
+            left.append(right.pop())
 
     def label(self, text: str) -> 'TextInput':
         self._label = text
@@ -54,6 +143,7 @@ class TextInput:
 
     def focus(self) -> None:
         self.focused = True
+        self._blink_tag += 1
         self._blink_active = False
         self._cursor_visible = True
 
@@ -63,18 +153,32 @@ class TextInput:
         self._blink_active = False
 
     def set_value(self, v: str) -> None:
-        self.value = v
-        self.cursor = len(v)
+        self._left = list(v)
+        self._right = []
+        self._value = v
 
-    def _new_blink_cmd(self) -> Cmd:
-        tag = self._blink_tag
+    def _insert(self, ch: str) -> None:
+        if self.char_limit == 0 or len(self._left) + len(self._right) < self.char_limit:
+            self._left.append(ch)
+            self._value = None
 
-        def cmd():
-            import time
-            time.sleep(0.53)
-            return CursorBlinkMsg(tag=tag)
+    def paste(self, text: str) -> None:
+        """Insert text at the cursor in one step.
 
-        return cmd
+        Line breaks and tabs become spaces; other unprintable characters are
+        dropped, and the text is cut to fit char_limit.
+        """
+        text = text.replace('\r\n', ' ').translate(_PASTE_SPACES)
+        if not text.isprintable():
+            text = ''.join(filter(str.isprintable, text))
+        if self.char_limit:
+            text = text[:max(0, self.char_limit - len(self._left) - len(self._right))]
+        if text:
+            self._left.extend(text)
+            self._value = None
+
+    def _new_blink_cmd(self, delay: float = _BLINK_INTERVAL) -> Cmd:
+        return TickCmd(delay, CursorBlinkMsg(tag=self._blink_tag))
 
     def update(self, msg: Msg) -> tuple['TextInput', Cmd]:
         if not self.focused:
@@ -83,6 +187,10 @@ class TextInput:
         # Handle blink messages
         if isinstance(msg, CursorBlinkMsg):
             if msg.tag == self._blink_tag:
+                hold = self._blink_hold - time.monotonic()
+                if hold > 0:
+                    # Typed since this tick was scheduled: stay solid
+                    return self, self._new_blink_cmd(hold)
                 self._cursor_visible = not self._cursor_visible
                 return self, self._new_blink_cmd()
             # Stale tag — ignore, but start blink if needed (falls through below)
@@ -94,102 +202,133 @@ class TextInput:
             self._cursor_visible = True
             blink_cmd = self._new_blink_cmd()
 
-        if not isinstance(msg, KeyMsg):
+        if not isinstance(msg, (KeyMsg, PasteMsg)):
             return self, blink_cmd
 
-        # On any key press, reset cursor to visible and restart blink
+        # On any key press, show the cursor and hold off the running blink
+        # tick rather than starting a new one
         self._cursor_visible = True
-        self._blink_tag += 1
-        self._blink_active = True
-        blink_cmd = self._new_blink_cmd() if self.cursor_blink else None
-
-        key = msg.key
-
-        if key == 'backspace':
-            if self.cursor > 0:
-                self.value = self.value[:self.cursor - 1] + self.value[self.cursor:]
-                self.cursor -= 1
-        elif key == 'delete':
-            if self.cursor < len(self.value):
-                self.value = self.value[:self.cursor] + self.value[self.cursor + 1:]
-        elif key == 'left':
-            self.cursor = max(0, self.cursor - 1)
-        elif key == 'right':
-            self.cursor = min(len(self.value), self.cursor + 1)
-        elif key == 'home' or key == 'ctrl+a':
-            self.cursor = 0
-        elif key == 'end' or key == 'ctrl+e':
-            self.cursor = len(self.value)
-        elif key == 'ctrl+k':
-            # Kill to end of line
-            self.value = self.value[:self.cursor]
-        elif key == 'ctrl+u':
-            # Kill to start of line
-            self.value = self.value[self.cursor:]
-            self.cursor = 0
-        elif key == 'ctrl+w':
-            # Kill word backward
-            if self.cursor > 0:
-                i = self.cursor - 1
-                while i > 0 and self.value[i - 1] == ' ':
-                    i -= 1
-                while i > 0 and self.value[i - 1] != ' ':
-                    i -= 1
-                self.value = self.value[:i] + self.value[self.cursor:]
-                self.cursor = i
-        elif msg.char and len(msg.char) == 1 and msg.char.isprintable():
-            if self.char_limit == 0 or len(self.value) < self.char_limit:
-                self.value = self.value[:self.cursor] + msg.char + self.value[self.cursor:]
-                self.cursor += 1
-        elif key == 'space':
-            if self.char_limit == 0 or len(self.value) < self.char_limit:
-                self.value = self.value[:self.cursor] + ' ' + self.value[self.cursor:]
-                self.cursor += 1
+        if self.cursor_blink:
+            self._blink_hold = time.monotonic() + _BLINK_INTERVAL
+
+        if isinstance(msg, PasteMsg):
+            self.paste(msg.text)
+            return self, blink_cmd
+
+        handler = _KEY_HANDLERS.get(msg.key)
+        if handler is not None:
+            handler(self)
+        else:
+            ch = msg.char
+            # Printable ASCII is a range check; only non-ASCII hits isprintable()
+            if len(ch) == 1 and (' ' <= ch <= '~' or ch.isprintable()):
+                self._insert(ch)
 
         return self, blink_cmd
 
+    # ── Key handlers (dispatched via _KEY_HANDLERS) ──
+
+    def _backspace(self) -> None:
+        if self._left:
+            self._left.pop()
+            self._value = None
+
+    def _delete(self) -> None:
+        if self._right:
+            self._right.pop()
+            self._value = None
+
+    def _cursor_left(self) -> None:
+        if self._left:
+            self._right.append(self._left.pop())
+
+    def _cursor_right(self) -> None:
+        if self._right:
+            self._left.append(self._right.pop())
+
+    def _cursor_start(self) -> None:
+        self.cursor = 0
+
+    def _cursor_end(self) -> None:
+        self.cursor = len(self._left) + len(self._right)
+
+    def _kill_to_end(self) -> None:
+        if self._right:
+            self._right.clear()
+            self._value = None
+
+    def _kill_to_start(self) -> None:
+        if self._left:
+            self._left.clear()
+            self._value = None
+
+    def _kill_word_back(self) -> None:
+        left = self._left
+        if left:
+            # Keep everything up to the space before the last word
+            del left[''.join(left).rstrip(' ').rfind(' ') + 1:]
+            self._value = None
+
+    def _insert_space(self) -> None:
+        self._insert(' ')
+
     def view(self) -> str:
         lines: list[str] = []
 
         # Label
         if self._label:
-            lbl = self._label
-            if self.label_style:
-                lbl = self.label_style.render(lbl)
-            lines.append(lbl)
+            lines.append(self._styled(_LABEL, self._label, self.label_style))
 
         # Build input line
         prompt = self.prompt if self.prompt else ''
-        if self.prompt_style and prompt:
-            prompt = self.prompt_style.render(prompt)
+        if prompt:
+            prompt = self._styled(_PROMPT, prompt, self.prompt_style)
 
         if not self.value and not self.focused:
             # Show placeholder
-            ph = self.placeholder
-            if self.placeholder_style:
-                ph = self.placeholder_style.render(ph)
-            lines.append(prompt + ph)
+            lines.append(prompt + self._styled(_PLACEHOLDER, self.placeholder, self.placeholder_style))
         else:
             # Show value with cursor
             display = self.value
-            if self.focused and self.cursor <= len(display):
-                # Insert visual cursor
-                before = display[:self.cursor]
-                after = display[self.cursor:]
-                cursor_char = after[0] if after else ' '
-                after = after[1:] if after else ''
+            if self.focused:
+                right = self._right
+                cursor_char = right[-1] if right else ' '
                 # Render cursor character — blink off shows plain char
                 if self._cursor_visible or not self.cursor_blink:
-                    cs = (self.cursor_style or Style()).reverse()
-                    cursor_display = cs.render(cursor_char)
+                    cursor_display = self._cursor_render_style().render(cursor_char)
                 else:
                     cursor_display = cursor_char
-                display = before + cursor_display + after
+                if not right:
+                    # Cursor at end of input: nothing to split
+                    display += cursor_display
+                else:
+                    before = ''.join(self._left)
+                    after = ''.join(reversed(right[:-1]))
+                    display = before + cursor_display + after
 
             lines.append(prompt + display)
 
         return '\n'.join(lines)
 
+    def _styled(self, slot: int, text: str, style: Style | None) -> str:
+        """style.render(text), reused while text and style are unchanged."""
+        if not style:
+            return text
+        cached = self._styled_cache[slot]
+        if cached is None or cached[1] is not style or cached[0] != text:
+            cached = self._styled_cache[slot] = (text, style, style.render(text))
+        return cached[2]
+
+    def _cursor_render_style(self) -> Style:
+        """Reversed cursor style, rebuilt only when cursor_style changes."""
+        cs = self.cursor_style
+        if cs is None:
+            return _DEFAULT_CURSOR
+        cached = self._cursor_rev
+        if cached is None or cached[0] is not cs:
+            cached = self._cursor_rev = (cs, cs.reverse())
+        return cached[1]
+
     def cursor_position(self) -> tuple[int, int] | None:
         """Return (row, col) of the hardware cursor relative to this component's output.
 
@@ -200,5 +339,21 @@ class TextInput:
             return None
         row = 1 if self._label else 0
         prompt = self.prompt if self.prompt else ''
-        col = strutil.visible_width(prompt) + self.cursor
+        col = strutil.cached_visible_width(prompt) + self.cursor
         return (row, col)
+
+
+_KEY_HANDLERS: dict[str, Callable[[TextInput], None]] = {
+    'backspace': TextInput._backspace,
+    'delete': TextInput._delete,
+    'left': TextInput._cursor_left,
+    'right': TextInput._cursor_right,
+    'home': TextInput._cursor_start,
+    'ctrl+a': TextInput._cursor_start,
+    'end': TextInput._cursor_end,
+    'ctrl+e': TextInput._cursor_end,
+    'ctrl+k': TextInput._kill_to_end,
+    'ctrl+u': TextInput._kill_to_start,
+    'ctrl+w': TextInput._kill_word_back,
+    'space': TextInput._insert_space,
+}
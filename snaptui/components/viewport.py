@@ -6,13 +6,25 @@ Equivalent to bubbles/viewport. Used for detail screens with scrollable content.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 from .. import strutil
 from ..keys import KeyMsg
 from ..model import Cmd, Msg, WindowSizeMsg
 
 
-@dataclass
+# Blank padding rows, one string per viewport width
+_BLANK_CACHE: dict[int, str] = {}
+
+
+def _blank(width: int) -> str:
+    s = _BLANK_CACHE.get(width)
+    if s is None:
+        s = _BLANK_CACHE[width] = ' ' * width
+    return s
+
+
+@dataclass(slots=True)
 class Viewport:
     """Scrollable text viewport.
 
@@ -23,16 +35,37 @@ class Viewport:
     height: int = 24
     y_offset: int = 0
     _lines: list[str] = field(default_factory=list)
+    # Cached max scroll offset and the height it was computed for; _lines
+    # only changes in set_content(), which resets the cache.
+    _max_off: int = field(default=0, init=False, repr=False, compare=False)
+    _max_off_height: int = field(default=-1, init=False, repr=False, compare=False)
+    # Fitted (truncated + padded) copy of each line, filled lazily by view()
+    # and keyed on the width it was fitted to
+    _rendered: list[str | None] = field(default_factory=list, init=False, repr=False, compare=False)
+    _rendered_width: int = field(default=-1, init=False, repr=False, compare=False)
+    # Raw content and width of the last set_content() call
+    _content: str | None = field(default=None, init=False, repr=False, compare=False)
+    _content_width: int = field(default=-1, init=False, repr=False, compare=False)
 
     def set_content(self, content: str) -> None:
         """Set the content to display. Wraps lines to viewport width."""
-        self._lines = []
+        width = self.width
+        # Same content at the same width wraps to the same lines
+        if content == self._content and width == self._content_width:
+            self.y_offset = min(self.y_offset, self._max_offset())
+            return
+        lines: list[str] = []
         for line in content.split('\n'):
-            if strutil.visible_width(line) > self.width:
-                wrapped = strutil.word_wrap(line, self.width)
-                self._lines.extend(wrapped.split('\n'))
+            # ASCII lines no longer than the width cannot overflow it
+            if (line.isascii() and len(line) <= width) or strutil.visible_width(line) <= width:
+                lines.append(line)
             else:
-                self._lines.append(line)
+                lines.extend(strutil.word_wrap_lines(line, width))
+        self._lines = lines
+        self._content = content
+        self._content_width = width
+        self._rendered = [None] * len(lines)
+        self._max_off_height = -1
         # Clamp offset
         self.y_offset = min(self.y_offset, self._max_offset())
 
@@ -56,7 +89,10 @@ class Viewport:
         return self.y_offset / mo
 
     def _max_offset(self) -> int:
-        return max(0, len(self._lines) - self.height)
+        if self._max_off_height != self.height:
+            self._max_off = max(0, len(self._lines) - self.height)
+            self._max_off_height = self.height
+        return self._max_off
 
     def line_up(self, n: int = 1) -> None:
         self.y_offset = max(0, self.y_offset - n)
@@ -85,23 +121,9 @@ class Viewport:
     def update(self, msg: Msg) -> tuple[Viewport, Cmd]:
         """Handle messages. Returns (self, cmd)."""
         if isinstance(msg, KeyMsg):
-            key = msg.key
-            if key in ('up', 'k'):
-                self.line_up()
-            elif key in ('down', 'j'):
-                self.line_down()
-            elif key == 'pgup':
-                self.page_up()
-            elif key == 'pgdown':
-                self.page_down()
-            elif key == 'home':
-                self.goto_top()
-            elif key == 'end':
-                self.goto_bottom()
-            elif key == 'ctrl+u':
-                self.half_page_up()
-            elif key == 'ctrl+d':
-                self.half_page_down()
+            handler = _KEY_HANDLERS.get(msg.key)
+            if handler is not None:
+                handler(self)
         elif isinstance(msg, WindowSizeMsg):
             self.width = msg.width
             self.height = msg.height
@@ -109,13 +131,37 @@ class Viewport:
 
     def view(self) -> str:
         """Render visible portion of content."""
-        visible = self._lines[self.y_offset:self.y_offset + self.height]
-        # Pad/truncate each line to viewport width
+        width = self.width
+        lines = self._lines
+        rendered = self._rendered
+        if self._rendered_width != width or len(rendered) != len(lines):
+            rendered = self._rendered = [None] * len(lines)
+            self._rendered_width = width
+        # Fit each visible line to viewport width, reusing earlier frames
+        start = max(0, self.y_offset)
+        stop = min(start + self.height, len(lines))
         result: list[str] = []
-        for line in visible:
-            result.append(strutil.pad_right(strutil.truncate(line, self.width), self.width))
-        # Pad remaining height with blank lines
-        blank = ' ' * self.width
-        while len(result) < self.height:
-            result.append(blank)
+        for i in range(start, stop):
+            line = rendered[i]
+            if line is None:
+                line = rendered[i] = strutil.fit_width(lines[i], width)
+            result.append(line)
+        # Pad remaining height with blank lines in one extend
+        pad = self.height - len(result)
+        if pad > 0:
+            result.extend([_blank(width)] * pad)
         return '\n'.join(result)
+
+
+_KEY_HANDLERS: dict[str, Callable[[Viewport], None]] = {
+    'up': Viewport.line_up,
+    'k': Viewport.line_up,
+    'down': Viewport.line_down,
+    'j': Viewport.line_down,
+    'pgup': Viewport.page_up,
+    'pgdown': Viewport.page_down,
+    'home': Viewport.goto_top,
+    'end': Viewport.goto_bottom,
+    'ctrl+u': Viewport.half_page_up,
+    'ctrl+d': Viewport.half_page_down,
+}
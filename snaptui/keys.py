@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import base64
 import os
+import re
 import select
 from dataclasses import dataclass
 from enum import IntFlag
@@ -100,6 +101,9 @@ class KeyMsg:
         return bool(self.mod & Mod.ALT)
 
     def __eq__(self, other):
+        # Identity first: key names like 'enter' are interned literals
+        if other is self.key:
+            return True
         if isinstance(other, str):
             return self.key == other
         if isinstance(other, KeyMsg):
@@ -244,9 +248,54 @@ CTRL_MAP: dict[int, str] = {
     127: 'backspace',
 }
 
+# CTRL_MAP as a table indexed by byte value (None where unmapped)
+_CTRL_NAMES: tuple[str | None, ...] = tuple(CTRL_MAP.get(i) for i in range(256))
+
+
+def _byte_msg(byte: int) -> KeyMsg | None:
+    name = _CTRL_NAMES[byte]
+    if name is not None:
+        return KeyMsg(name, mod=Mod.CTRL if name.startswith('ctrl+') else Mod.NONE)
+    if byte == 0x20:
+        return KeyMsg(KEY_SPACE, ' ')
+    if 0x20 < byte < 0x7f:
+        return KeyMsg(chr(byte), chr(byte))
+    return None
+
+
+# Prebuilt events for every single-byte key (control characters and
+# printable ASCII), indexed by byte. KeyMsg is frozen, so read_key hands out
+# shared instances instead of allocating one per keypress.
+_BYTE_MSGS: tuple[KeyMsg | None, ...] = tuple(_byte_msg(i) for i in range(256))
+
 
 # ── Key reading ───────────────────────────────────────────────────────────────
 
+# Terminals write a whole key sequence (or paste chunk) at once, so input is
+# drained with one bulk os.read and parsed from this per-fd buffer.
+_READ_SIZE = 4096
+_pending: dict[int, bytearray] = {}
+
+
+def _read1(fd: int, timeout: float) -> bytes:
+    """Return the next input byte, refilling with a single bulk read.
+
+    Returns b'' if nothing arrives within timeout (or on EOF).
+    """
+    pending = _pending.get(fd)
+    if not pending:
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return b''
+        data = os.read(fd, _READ_SIZE)
+        if len(data) <= 1:
+            return data
+        pending = _pending[fd] = bytearray(data)
+    b = bytes(pending[:1])
+    del pending[0]
+    return b
+
+
 def read_key(fd: int, timeout: float = 0.05) -> KeyMsg | MouseMsg | ClipboardMsg | None:
     """Read one key event from raw stdin.
 
@@ -257,12 +306,8 @@ def read_key(fd: int, timeout: float = 0.05) -> KeyMsg | MouseMsg | ClipboardMsg
     Returns:
         KeyMsg, MouseMsg, or None if no data available within timeout
     """
-    # Wait for data
-    ready, _, _ = select.select([fd], [], [], timeout)
-    if not ready:
-        return None
-
-    b = os.read(fd, 1)
+    # Wait for data (already-buffered bytes are returned immediately)
+    b = _read1(fd, timeout)
     if not b:
         return None
 
@@ -272,74 +317,64 @@ def read_key(fd: int, timeout: float = 0.05) -> KeyMsg | MouseMsg | ClipboardMsg
     if byte == 0x1b:
         return _read_escape_sequence(fd, b)
 
-    # Control characters
-    if byte in CTRL_MAP:
-        name = CTRL_MAP[byte]
-        mod = Mod.CTRL if name.startswith('ctrl+') else Mod.NONE
-        return KeyMsg(name, mod=mod)
+    # Control characters and printable ASCII: shared immutable instances
+    msg = _BYTE_MSGS[byte]
+    if msg is not None:
+        return msg
 
-    # Printable ASCII / UTF-8
+    # UTF-8
     try:
         char = _read_utf8(fd, b)
-        if char == ' ':
-            return KeyMsg(KEY_SPACE, ' ')
         return KeyMsg(char, char)
     except (UnicodeDecodeError, ValueError):
         return KeyMsg(f'unknown({byte})')
 
 
-def _parse_sgr_mouse(buf: bytes) -> MouseMsg | None:
-    """Parse SGR mouse event: ESC [ < btn ; x ; y [Mm]."""
-    # buf should be like b'\x1b[<0;10;5M' or b'\x1b[<0;10;5m'
-    try:
-        text = buf.decode('ascii')
-    except (UnicodeDecodeError, ValueError):
-        return None
+def read_keys(fd: int, timeout: float = 0.05) -> list[KeyMsg | MouseMsg | ClipboardMsg]:
+    """Read every event that is already available from raw stdin.
 
-    if not text.startswith('\x1b[<'):
-        return None
+    Waits up to timeout for the first event, then parses whatever else has
+    arrived (refilling without waiting) so a paste or fast typing comes
+    back as one list. Returns [] if nothing arrives within timeout.
+    """
+    msg = read_key(fd, timeout)
+    if msg is None:
+        return []
+    msgs = [msg]
+    while (msg := read_key(fd, 0)) is not None:
+        msgs.append(msg)
+    return msgs
 
-    terminator = text[-1]
-    if terminator not in ('M', 'm'):
-        return None
 
-    parts = text[3:-1].split(';')
-    if len(parts) != 3:
-        return None
+# ESC [ < btn ; x ; y, then M for press/motion or m for release
+_SGR_MOUSE_RE = re.compile(rb'\x1b\[<(\d+);(\d+);(\d+)([Mm])')
+# Indexed by the low two bits of the button code
+_SGR_BUTTONS = (MouseButton.LEFT, MouseButton.MIDDLE, MouseButton.RIGHT, MouseButton.NONE)
 
-    try:
-        btn_code = int(parts[0])
-        x = int(parts[1]) - 1  # 1-based to 0-based
-        y = int(parts[2]) - 1
-    except ValueError:
+
+def _parse_sgr_mouse(buf: bytes | bytearray) -> MouseMsg | None:
+    """Parse SGR mouse event: ESC [ < btn ; x ; y [Mm]."""
+    # buf should be like b'\x1b[<0;10;5M' or b'\x1b[<0;10;5m'
+    m = _SGR_MOUSE_RE.fullmatch(buf)
+    if m is None:
         return None
+    btn, x, y, terminator = m.groups()
+    btn_code = int(btn)
+    x = int(x) - 1  # 1-based to 0-based
+    y = int(y) - 1
 
-    # Decode button and action
-    button_bits = btn_code & 0x03
-    is_motion = bool(btn_code & 32)
-    is_wheel = bool(btn_code & 64)
-
-    if is_wheel:
-        action = MouseAction.WHEEL_UP if button_bits == 0 else MouseAction.WHEEL_DOWN
-        return MouseMsg(x=x, y=y, button=MouseButton.NONE, action=action)
-
-    if button_bits == 0:
-        button = MouseButton.LEFT
-    elif button_bits == 1:
-        button = MouseButton.MIDDLE
-    elif button_bits == 2:
-        button = MouseButton.RIGHT
-    else:
-        button = MouseButton.NONE
+    if btn_code & 64:  # wheel
+        action = MouseAction.WHEEL_UP if (btn_code & 0x03) == 0 else MouseAction.WHEEL_DOWN
+        return MouseMsg(x, y, MouseButton.NONE, action)
 
-    if is_motion:
+    if btn_code & 32:
         action = MouseAction.MOTION
-    elif terminator == 'm':
+    elif terminator == b'm':
         action = MouseAction.RELEASE
     else:
         action = MouseAction.PRESS
 
-    return MouseMsg(x=x, y=y, button=button, action=action)
+    return MouseMsg(x, y, _SGR_BUTTONS[btn_code & 0x03], action)
 
 
 PASTE_START = b'\x1b[200~'
@@ -351,9 +386,18 @@ FOCUS_OUT = b'\x1b[O'
 
 def _read_paste(fd: int) -> PasteMsg:
     """Read pasted text until the end-of-paste sequence."""
-    buf = bytearray()
+    # Start from whatever the bulk read already buffered
+    buf = _pending.pop(fd, None) or bytearray()
     end_seq = PASTE_END
     while True:
+        # Check for end sequence
+        idx = buf.find(end_seq)
+        if idx >= 0:
+            rest = buf[idx + len(end_seq):]
+            if rest:
+                _pending[fd] = rest
+            text = bytes(buf[:idx]).decode('utf-8', errors='replace')
+            return PasteMsg(text=text)
         ready, _, _ = select.select([fd], [], [], 1.0)
         if not ready:
             break
@@ -361,11 +405,6 @@ def _read_paste(fd: int) -> PasteMsg:
         if not b:
             break
         buf.extend(b)
-        # Check for end sequence
-        idx = buf.find(end_seq)
-        if idx >= 0:
-            text = bytes(buf[:idx]).decode('utf-8', errors='replace')
-            return PasteMsg(text=text)
     # Timeout — return what we have
     return PasteMsg(text=buf.decode('utf-8', errors='replace'))
 
@@ -379,10 +418,7 @@ def _read_osc_response(fd: int) -> ClipboardMsg | KeyMsg:
     buf = bytearray()
     prev = 0
     for _ in range(8192):  # safety limit
-        ready, _, _ = select.select([fd], [], [], 1.0)
-        if not ready:
-            break
-        b = os.read(fd, 1)
+        b = _read1(fd, 1.0)
         if not b:
             break
         byte = b[0]
@@ -415,64 +451,96 @@ def _read_osc_response(fd: int) -> ClipboardMsg | KeyMsg:
     return KeyMsg(f'unknown(osc:{payload!r})')
 
 
+# ── Escape sequence trie ─────────────────────────────────────────────────────
+
+# Markers for trie leaves that need more input than the sequence itself
+_OSC = object()
+_PASTE = object()
+
+# Byte-indexed trie over everything after the leading ESC. State 0 is the
+# root; _TRIE[state] maps the next byte to the next state, and _TRIE_LEAF
+# maps complete sequences to their result.
+_TRIE: list[dict[int, int]] = [{}]
+_TRIE_LEAF: dict[int, object] = {}
+
+
+def _trie_add(seq: bytes, result: object) -> None:
+    state = 0
+    for byte in seq[1:]:  # skip ESC
+        nxt = _TRIE[state].get(byte)
+        if nxt is None:
+            nxt = len(_TRIE)
+            _TRIE.append({})
+            _TRIE[state][byte] = nxt
+        state = nxt
+    _TRIE_LEAF[state] = result
+
+
+for _seq, _msg in SEQUENCES.items():
+    _trie_add(_seq, _msg)
+_trie_add(b'\x1b]', _OSC)
+_trie_add(PASTE_START, _PASTE)
+_trie_add(FOCUS_IN, FocusMsg(focused=True))
+_trie_add(FOCUS_OUT, FocusMsg(focused=False))
+del _seq, _msg
+
+
+_MAX_SEQ_LEN = 32
+
+
 def _read_escape_sequence(fd: int, initial: bytes) -> KeyMsg | MouseMsg | PasteMsg | FocusMsg | ClipboardMsg:
     """Read an escape sequence after receiving ESC byte."""
-    buf = initial  # b'\x1b'
+    buf = bytearray(initial)  # b'\x1b', grown in place
+    state: int | None = 0
 
-    # Read more bytes with short timeout
-    for _ in range(7):  # Max escape sequence length
-        ready, _, _ = select.select([fd], [], [], 0.05)
-        if not ready:
-            break
-        b = os.read(fd, 1)
+    # Read more bytes with short timeout; room for SGR mouse reports
+    for _ in range(_MAX_SEQ_LEN - 1):
+        b = _read1(fd, 0.05)
         if not b:
             break
         buf += b
 
-        # Check for OSC start (ESC ])
-        if buf == b'\x1b]':
-            return _read_osc_response(fd)
-
-        # Check for bracketed paste start
-        if buf == PASTE_START:
-            return _read_paste(fd)
-
-        # Check for focus events
-        if buf == FOCUS_IN:
-            return FocusMsg(focused=True)
-        if buf == FOCUS_OUT:
-            return FocusMsg(focused=False)
-
-        # Check if we have a complete sequence
-        if buf in SEQUENCES:
-            return SEQUENCES[buf]
+        # Walk the trie while the bytes still match a known sequence
+        if state is not None:
+            state = _TRIE[state].get(b[0])
+            if state is not None:
+                leaf = _TRIE_LEAF.get(state)
+                if leaf is _OSC:
+                    return _read_osc_response(fd)
+                if leaf is _PASTE:
+                    return _read_paste(fd)
+                if leaf is not None:
+                    return leaf
+                continue
+
+        # Off the trie after one byte: ESC + key is Alt+key; don't wait for
+        # (and swallow) whatever was typed after it
+        if len(buf) == 2:
+            if buf[1] >= 0xC0:
+                # Alt + non-ASCII key: pull in the rest of the character
+                try:
+                    char = _read_utf8(fd, b)
+                except (UnicodeDecodeError, ValueError):
+                    break
+                return KeyMsg(f'alt+{char}', char, mod=Mod.ALT)
+            break
 
-        # Check if we're in a CSI sequence (ESC [ ... letter)
-        if len(buf) >= 3 and buf[1:2] == b'[':
+        # Off the trie: decide when an unknown CSI/SS3 sequence has ended
+        if len(buf) >= 3 and buf[1] == 0x5B:  # ESC [
             last = buf[-1]
             # SGR mouse: ESC [ < ... M/m
-            if len(buf) >= 4 and buf[2:3] == b'<' and last in (ord('M'), ord('m')):
+            if len(buf) >= 4 and buf[2] == 0x3C and last in (0x4D, 0x6D):
                 mouse = _parse_sgr_mouse(buf)
                 if mouse:
                     return mouse
             # CSI sequences end with a letter (0x40-0x7E)
             if 0x40 <= last <= 0x7E:
-                if buf in SEQUENCES:
-                    return SEQUENCES[buf]
-                # Unknown CSI sequence
-                return KeyMsg(f'unknown({buf!r})')
+                return KeyMsg(f'unknown({bytes(buf)!r})')
 
         # SS3 sequences (ESC O letter)
-        if len(buf) >= 3 and buf[1:2] == b'O':
-            last = buf[-1]
-            if 0x40 <= last <= 0x7E:
-                if buf in SEQUENCES:
-                    return SEQUENCES[buf]
-                return KeyMsg(f'unknown({buf!r})')
-
-    # Check final accumulated buffer
-    if buf in SEQUENCES:
-        return SEQUENCES[buf]
+        if len(buf) >= 3 and buf[1] == 0x4F:
+            if 0x40 <= buf[-1] <= 0x7E:
+                return KeyMsg(f'unknown({bytes(buf)!r})')
 
     # Just ESC alone or Alt+key
     if len(buf) == 1:
@@ -484,12 +552,12 @@ def _read_escape_sequence(fd: int, initial: bytes) -> KeyMsg | MouseMsg | PasteM
         if 32 <= second < 127:
             char = chr(second)
             return KeyMsg(f'alt+{char}', char, mod=Mod.ALT)
-        if second in CTRL_MAP:
-            ctrl_name = CTRL_MAP[second]
+        ctrl_name = _CTRL_NAMES[second]
+        if ctrl_name is not None:
             mod = Mod.ALT | Mod.CTRL if ctrl_name.startswith('ctrl+') else Mod.ALT
             return KeyMsg(f'alt+{ctrl_name}', mod=mod)
 
-    return KeyMsg(f'unknown({buf!r})')
+    return KeyMsg(f'unknown({bytes(buf)!r})')
 
 
 def _read_utf8(fd: int, initial: bytes) -> str:
@@ -509,9 +577,9 @@ def _read_utf8(fd: int, initial: bytes) -> str:
     else:
         raise ValueError(f'Invalid UTF-8 start byte: {first:#x}')
 
-    buf = initial
+    buf = bytearray(initial)
     for _ in range(remaining):
-        b = os.read(fd, 1)
+        b = _read1(fd, 0.05)
         if not b:
             raise ValueError('Incomplete UTF-8 sequence')
         buf += b
@@ -5,6 +5,8 @@ Equivalent to Lip Gloss's join functions and place helper.
 
 from __future__ import annotations
 
+import functools
+
 from . import strutil
 
 # Alignment constants
@@ -13,6 +15,31 @@ CENTER = 0.5
 RIGHT = BOTTOM = 1.0
 
 
+def _split_gap(gap: int, align: float) -> tuple[int, int]:
+    """Split gap into (before, after) padding for an alignment fraction."""
+    # The exported constants need no float math
+    if align == 0.0:
+        return 0, gap
+    if align == 1.0:
+        return gap, 0
+    if align == 0.5:
+        before = gap >> 1
+    else:
+        before = int(gap * align)
+    return before, gap - before
+
+
+@functools.lru_cache(maxsize=256)
+def _measure(block: str) -> tuple[tuple[str, ...], tuple[int, ...], int]:
+    """Split a block into lines, their visible widths, and the max width.
+
+    Memoized: panes that don't change between frames are measured once.
+    """
+    lines = tuple(block.split('\n'))
+    widths = tuple(strutil.visible_width(l) for l in lines)
+    return lines, widths, max(widths)
+
+
 def join_horizontal(align: float, *blocks: str) -> str:
     """Merge multi-line blocks side-by-side.
 
@@ -26,41 +53,25 @@ def join_horizontal(align: float, *blocks: str) -> str:
         return blocks[0]
 
     # Split each block into lines, determine dimensions
-    block_lines: list[list[str]] = []
-    widths: list[int] = []
-    heights: list[int] = []
-
-    for block in blocks:
-        lines = block.split('\n')
-        block_lines.append(lines)
-        w = max((strutil.visible_width(l) for l in lines), default=0)
-        widths.append(w)
-        heights.append(len(lines))
-
-    max_height = max(heights)
+    measured = [_measure(block) for block in blocks]
+    max_height = max(len(lines) for lines, _, _ in measured)
 
     # Pad each block to max_height based on alignment
     padded: list[list[str]] = []
-    for lines, w, h in zip(block_lines, widths, heights):
+    for lines, line_widths, w in measured:
+        # Ensure all lines are same width
+        # (ljust counts escape bytes, so widen by the invisible length)
+        lines = [l.ljust(w + len(l) - lw) if lw < w else l for l, lw in zip(lines, line_widths)]
+        h = len(lines)
         if h < max_height:
             gap = max_height - h
-            top_pad = int(gap * align)
-            bottom_pad = gap - top_pad
+            top_pad, bottom_pad = _split_gap(gap, align)
             blank = ' ' * w
             lines = [blank] * top_pad + lines + [blank] * bottom_pad
-        # Ensure all lines are same width
-        lines = [strutil.pad_right(l, w) for l in lines]
         padded.append(lines)
 
-    # Merge line by line
-    result: list[str] = []
-    for row in range(max_height):
-        parts: list[str] = []
-        for col, lines in enumerate(padded):
-            parts.append(lines[row])
-        result.append(''.join(parts))
-
-    return '\n'.join(result)
+    # Merge line by line: transpose the padded blocks into rows
+    return '\n'.join(map(''.join, zip(*padded)))
 
 
 def join_vertical(align: float, *blocks: str) -> str:
@@ -76,25 +87,24 @@ def join_vertical(align: float, *blocks: str) -> str:
         return blocks[0]
 
     # Find max width across all blocks
-    all_lines: list[str] = []
-    for block in blocks:
-        all_lines.extend(block.split('\n'))
-    max_width = max((strutil.visible_width(l) for l in all_lines), default=0)
+    measured = [_measure(block) for block in blocks]
+    max_width = max(w for _, _, w in measured)
 
     # Align each line
     result: list[str] = []
-    for line in all_lines:
-        vw = strutil.visible_width(line)
-        gap = max_width - vw
-        if gap <= 0 or align == 0.0:
-            result.append(line)
-        else:
-            left_pad = int(gap * align)
-            result.append(' ' * left_pad + line)
+    for lines, line_widths, _ in measured:
+        for line, vw in zip(lines, line_widths):
+            gap = max_width - vw
+            if gap <= 0 or align == 0.0:
+                result.append(line)
+            else:
+                result.append(line.rjust(len(line) + _split_gap(gap, align)[0]))
 
     return '\n'.join(result)
 
 
+# Dialogs and status bars are placed with the same arguments every frame
+@functools.lru_cache(maxsize=64)
 def place(width: int, height: int, h_align: float, v_align: float, content: str) -> str:
     """Place content within a canvas of given dimensions.
 
@@ -105,29 +115,35 @@ def place(width: int, height: int, h_align: float, v_align: float, content: str)
         v_align: Vertical alignment (0.0=top, 0.5=center, 1.0=bottom)
         content: Multi-line string to place
     """
-    lines = content.split('\n')
+    lines, line_widths, _ = _measure(content)
+    # Rows past the canvas are cut, so don't align them
+    if len(lines) > height:
+        lines = lines[:height]
 
     # Horizontal alignment: pad each line to canvas width
     aligned_lines: list[str] = []
-    for line in lines:
-        vw = strutil.visible_width(line)
+    for line, vw in zip(lines, line_widths):
         gap = width - vw
         if gap <= 0:
             aligned_lines.append(strutil.truncate(line, width))
         else:
-            left_pad = int(gap * h_align)
-            right_pad = gap - left_pad
-            aligned_lines.append(' ' * left_pad + line + ' ' * right_pad)
-
-    # Vertical alignment: pad with blank lines
+            left_pad = _split_gap(gap, h_align)[0]
+            full = len(line) + gap
+            if left_pad == 0:
+                aligned_lines.append(line.ljust(full))
+            elif left_pad == gap:
+                aligned_lines.append(line.rjust(full))
+            else:
+                aligned_lines.append((' ' * left_pad + line).ljust(full))
+
+    # Vertical alignment: pad with blank lines, built straight into the
+    # result by string repetition
+    body = '\n'.join(aligned_lines)
     content_height = len(aligned_lines)
     if content_height < height:
         gap = height - content_height
-        top_pad = int(gap * v_align)
-        bottom_pad = gap - top_pad
+        top_pad, bottom_pad = _split_gap(gap, v_align)
         blank = ' ' * width
-        aligned_lines = [blank] * top_pad + aligned_lines + [blank] * bottom_pad
-    elif content_height > height:
-        aligned_lines = aligned_lines[:height]
+        return (blank + '\n') * top_pad + body + ('\n' + blank) * bottom_pad
 
-    return '\n'.join(aligned_lines)
+    return body
@@ -5,6 +5,7 @@ Equivalent to Bubble Tea's tea.Model, tea.Msg, tea.Cmd.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Protocol, runtime_checkable
 
@@ -67,22 +68,62 @@ def quit_cmd() -> Msg:
     return QuitMsg()
 
 
-def batch(*cmds: Cmd) -> Cmd:
-    """Combine multiple commands into one. They run sequentially."""
-    filtered = [c for c in cmds if c is not None]
-    if not filtered:
-        return None
-    if len(filtered) == 1:
-        return filtered[0]
+@dataclass(frozen=True, slots=True)
+class TickCmd:
+    """Command that sends msg after delay seconds. Build with tick().
 
-    def run() -> list[Msg]:
+    Program runs these on one shared timer thread rather than a thread per
+    command; called directly, it just sleeps and returns msg.
+    """
+    delay: float
+    msg: Msg
+
+    def __call__(self) -> Msg:
+        time.sleep(self.delay)
+        return self.msg
+
+
+def tick(delay: float, msg: Msg) -> Cmd:
+    """Command that sends msg after delay seconds. Equivalent to tea.Tick."""
+    return TickCmd(delay, msg)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchCmd:
+    """Commands to run concurrently. Build with batch().
+
+    Program starts each one separately; called directly, they run in order
+    and their messages come back as a list.
+    """
+    cmds: tuple[Callable[[], Msg | None], ...]
+
+    def __call__(self) -> list[Msg] | None:
         msgs = []
-        for cmd in filtered:
+        for cmd in self.cmds:
             result = cmd()
-            if result is not None:
+            if isinstance(result, list):
+                msgs.extend(result)
+            elif result is not None:
                 msgs.append(result)
         return msgs if msgs else None
-    return run
+
+
+def batch(*cmds: Cmd) -> Cmd:
+    """Combine multiple commands into one. Equivalent to tea.Batch.
+
+    Nested batches are flattened, so every command is started on its own.
+    """
+    filtered: list[Callable[[], Msg | None]] = []
+    for c in cmds:
+        if type(c) is BatchCmd:
+            filtered.extend(c.cmds)
+        elif c is not None:
+            filtered.append(c)
+    if not filtered:
+        return None
+    if len(filtered) == 1:
+        return filtered[0]
+    return BatchCmd(tuple(filtered))
 
 
 # ── Model protocol ───────────────────────────────────────────────────────────
@@ -109,6 +150,9 @@ class Model(Protocol):
     - update(msg) -> tuple[Model, Cmd]: Handle a message, return new state + command
     - view() -> str: Render current state as a string
     - subscriptions() -> list[Sub]: Declare background listeners (optional)
+    - view_focused() -> tuple[int, str | View] | None: Re-render only the
+      region that changed, as (first row, content) spliced over the
+      previous frame's lines; None means call view() (optional)
     """
 
     def init(self) -> Cmd:
@@ -5,17 +5,29 @@ Ties together terminal, keys, model, and renderer.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import os
 import signal
 import sys
 import threading
+import time
 from queue import Empty, Queue
+from typing import Callable
 
 from . import keys
 from . import terminal
-from .model import Cmd, Model, Msg, QuitMsg, Sub, View, WindowSizeMsg, batch
+from .model import BatchCmd, Cmd, Model, Msg, QuitMsg, Sub, TickCmd, View, WindowSizeMsg
 from .renderer import Renderer
 
+# How often the input reader rechecks for shutdown while stdin is idle
+_READER_POLL = 0.1
+
+
+class _InputBurst(tuple):
+    """Input events the reader parsed from one read, applied before rendering."""
+    __slots__ = ()
+
 
 class Program:
     """Runs a Bubble Tea-style application.
@@ -43,10 +55,40 @@ class Program:
         self._renderer = Renderer()
         self._width = 80
         self._height = 24
-        self._prev_view: View | None = None
+        self._prev_view: View | None = None     # last frame handed to the writer
+        self._painted_view: View | None = None  # last frame the writer drew
         self._active_subs: dict[str, callable] = {}  # key -> stop()
         self._fd: int | None = None
         self._old_state: list | None = None
+        self._reader: threading.Thread | None = None
+        self._dirty = False  # model changed since the last render
+        self._resized = False  # size changed since the last render
+        # Pending tick() commands as a heap of (deadline, seq, msg), served
+        # by one timer thread started on first use
+        self._timers: list[tuple[float, int, Msg]] = []
+        self._timer_seq = itertools.count()
+        self._timer_cond = threading.Condition()
+        self._timer_thread: threading.Thread | None = None
+        # Frames are painted on a writer thread so slow terminal writes don't
+        # hold up input handling. _frame is a one-slot mailbox of
+        # (view, width, height, repaint): newer frames replace unpainted ones
+        self._frame: tuple[View, int, int, bool] | None = None
+        self._frame_cond = threading.Condition()
+        self._writer: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+
+    @property
+    def model(self) -> Model:
+        return self._model
+
+    @model.setter
+    def model(self, model: Model) -> None:
+        # Bound methods are resolved once per model rather than per message
+        self._model = model
+        self._model_update = model.update
+        self._model_view = model.view
+        self._model_subscriptions = getattr(model, 'subscriptions', None)
+        self._model_view_focused = getattr(model, 'view_focused', None)
 
     def run(self) -> Model:
         """Run the program. Blocks until quit. Returns final model."""
@@ -85,19 +127,35 @@ class Program:
             self._sync_subs()
 
             # Initial render
+            self._writer = threading.Thread(target=self._write_frames, daemon=True)
+            self._writer.start()
             self._render()
 
-            # Main loop
-            while not self._quit:
-                # Read keyboard (with timeout for queue checking)
-                key_msg = keys.read_key(fd, timeout=0.02)
-                if key_msg:
-                    self._process(key_msg)
+            # Input arrives on the same queue as async results
+            self._reader = threading.Thread(target=self._read_input, args=(fd,), daemon=True)
+            self._reader.start()
 
-                # Drain async message queue
+            # Main loop: sleep until there is something to process, then
+            # handle everything that queued up and render once
+            while not self._quit:
+                self._process(self._queue.get())
                 self._drain_queue()
+                if self._dirty and not self._quit:
+                    self._render()
 
         finally:
+            # Stop the input reader before handing the terminal back
+            self._quit = True
+            with self._timer_cond:
+                self._timer_cond.notify()
+            # Let the writer finish its current frame before teardown
+            with self._frame_cond:
+                self._frame_cond.notify()
+            if self._writer is not None:
+                self._writer.join()
+            if self._reader is not None:
+                self._reader.join(_READER_POLL * 2)
+
             # Stop all subscriptions
             self._stop_all_subs()
 
@@ -112,44 +170,92 @@ class Program:
             terminal.write(teardown)
             terminal.restore(fd, old_state)
 
+        if self._writer_error is not None:
+            raise self._writer_error
         return self.model
 
+    def _read_input(self, fd: int) -> None:
+        """Reader thread: forward terminal input events to the queue.
+
+        Keys that are already buffered (fast typing, an unbracketed paste)
+        are parsed without waiting and queued as one _InputBurst, so the main
+        loop applies the whole burst before rendering.
+        """
+        while not self._quit:
+            burst = keys.read_keys(fd, timeout=_READER_POLL)
+            if burst:
+                self._queue.put(_InputBurst(burst) if len(burst) > 1 else burst[0])
+
     def _on_resize(self, width: int, height: int) -> None:
         """Called from SIGWINCH handler."""
         self._queue.put(WindowSizeMsg(width, height))
 
     def _process(self, msg: Msg) -> None:
         """Send a message through update, handle result."""
-        if isinstance(msg, QuitMsg):
-            self._quit = True
+        # Messages the program handles itself, routed by type
+        hook = _MSG_HOOKS.get(type(msg))
+        if hook is None:
+            # Subclasses of the hooked messages resolve via their MRO
+            for cls in type(msg).__mro__[1:]:
+                hook = _MSG_HOOKS.get(cls)
+                if hook is not None:
+                    break
+        if hook is not None and hook(self, msg):
             return
 
+        new_model, cmd = self._model_update(msg)
+        if new_model is not self._model:
+            self.model = new_model
+        self._exec_cmd(cmd)
+        self._sync_subs()
+        self._dirty = True
+
+    # ── Program-level message hooks (dispatched via _MSG_HOOKS) ──
+    # Each returns True when the message is consumed and skips update().
+
+    def _on_burst(self, msgs: _InputBurst) -> bool:
+        # A burst of input events from the reader
+        for m in msgs:
+            if self._quit:
+                break
+            self._process(m)
+        return True
+
+    def _on_quit(self, msg: QuitMsg) -> bool:
+        self._quit = True
+        return True
+
+    def _on_key(self, msg: keys.KeyMsg) -> bool:
         # Handle Ctrl+Z: trigger SIGTSTP for suspend
-        if isinstance(msg, keys.KeyMsg) and msg.key == 'ctrl+z':
+        if msg.key == 'ctrl+z':
             os.kill(os.getpid(), signal.SIGTSTP)
-            return
+            return True
+        return False
 
-        if isinstance(msg, WindowSizeMsg):
-            self._width = msg.width
-            self._height = msg.height
-            self._renderer.repaint()
-
-        new_model, cmd = self.model.update(msg)
-        self.model = new_model
-        self._exec_cmd(cmd)
-        self._sync_subs()
-        self._render()
+    def _on_window_size(self, msg: WindowSizeMsg) -> bool:
+        self._width = msg.width
+        self._height = msg.height
+        self._resized = True
+        return False
 
     def _exec_cmd(self, cmd: Cmd) -> None:
         """Execute a command, feeding result back as a message."""
         if cmd is None:
             return
+        if type(cmd) is TickCmd:
+            self.schedule_after(cmd.delay, cmd.msg)
+            return
+        if type(cmd) is BatchCmd:
+            # Start each batched command independently, so a slow one
+            # doesn't hold back the others' results
+            for c in cmd.cmds:
+                self._exec_cmd(c)
+            return
 
         def run():
             result = cmd()
             if result is not None:
                 if isinstance(result, list):
-                    # batch() returns a list of messages
                     for msg in result:
                         self._queue.put(msg)
                 else:
@@ -158,21 +264,46 @@ class Program:
         t = threading.Thread(target=run, daemon=True)
         t.start()
 
+    def schedule_after(self, delay: float, msg: Msg) -> None:
+        """Send msg to the program after delay seconds (thread-safe)."""
+        with self._timer_cond:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), msg))
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._run_timers, daemon=True)
+                self._timer_thread.start()
+            self._timer_cond.notify()
+
+    def _run_timers(self) -> None:
+        """Timer thread: queue each scheduled message once it is due."""
+        timers = self._timers
+        with self._timer_cond:
+            while not self._quit:
+                now = time.monotonic()
+                while timers and timers[0][0] <= now:
+                    self._queue.put(heapq.heappop(timers)[2])
+                self._timer_cond.wait(timers[0][0] - now if timers else None)
+
     def _drain_queue(self) -> None:
-        """Process all pending messages from the async queue."""
-        while True:
+        """Process the messages already waiting, without blocking.
+
+        Bounded to what was queued on entry, so a producer that refills the
+        queue as fast as it drains cannot hold off the next render.
+        """
+        for _ in range(self._queue.qsize()):
+            if self._quit:
+                break
             try:
                 msg = self._queue.get_nowait()
-                self._process(msg)
             except Empty:
                 break
+            self._process(msg)
 
     def _sync_subs(self) -> None:
         """Start/stop subscriptions to match model.subscriptions()."""
-        if not hasattr(self.model, 'subscriptions'):
+        if self._model_subscriptions is None:
             return
 
-        desired = self.model.subscriptions()
+        desired = self._model_subscriptions()
         desired_keys = {s.key for s in desired}
 
         # Stop removed subscriptions
@@ -195,18 +326,79 @@ class Program:
 
     def _render(self) -> None:
         """Render the current model view."""
-        result = self.model.view()
-        if isinstance(result, View):
-            view = result
-        else:
-            view = View(content=result, alt_screen=self._alt_screen)
-        self._apply_terminal_state(view)
-        self._renderer.render(view.content, self._width, self._height, cursor=view.cursor)
+        view = None
+        # A model that knows only one region changed can re-render just that
+        view_focused = self._model_view_focused
+        if view_focused is not None and self._prev_view is not None and not self._resized:
+            region = view_focused()
+            if region is not None:
+                view = self._splice_region(*region)
+        if view is None:
+            result = self._model_view()
+            if isinstance(result, View):
+                view = result
+            else:
+                view = View(content=result, alt_screen=self._alt_screen)
+        self._dirty = False
+        # Nothing to draw when the frame matches the last one (stale blink
+        # ticks, messages the model ignores), unless the terminal was resized
+        if not self._resized and view == self._prev_view:
+            return
+        with self._frame_cond:
+            # Keep a repaint request from a frame that never got painted
+            repaint = self._resized or (self._frame is not None and self._frame[3])
+            self._frame = (view, self._width, self._height, repaint)
+            self._frame_cond.notify()
+        self._resized = False
         self._prev_view = view
 
-    def _apply_terminal_state(self, view: View) -> None:
-        """Diff View terminal fields against previous frame and emit changes."""
+    def _splice_region(self, row: int, part: str | View) -> View | None:
+        """Previous frame with its lines from row on replaced by part.
+
+        The part's cursor is relative to the region; a plain string keeps
+        the previous cursor. Returns None if the region falls outside the
+        previous frame.
+        """
         prev = self._prev_view
+        lines = prev.content.split('\n')
+        if isinstance(part, View):
+            content, cursor = part.content, part.cursor
+            if cursor is not None:
+                cursor = (cursor[0] + row, cursor[1])
+        else:
+            content, cursor = part, prev.cursor
+        new_lines = content.split('\n')
+        if row < 0 or row + len(new_lines) > len(lines):
+            return None
+        lines[row:row + len(new_lines)] = new_lines
+        return View(content='\n'.join(lines), cursor=cursor,
+                    alt_screen=prev.alt_screen, window_title=prev.window_title)
+
+    def _write_frames(self) -> None:
+        """Writer thread: paint the latest frame until the program quits."""
+        cond = self._frame_cond
+        try:
+            while True:
+                with cond:
+                    while self._frame is None and not self._quit:
+                        cond.wait()
+                    frame, self._frame = self._frame, None
+                if frame is None:
+                    return
+                view, width, height, repaint = frame
+                if repaint:
+                    self._renderer.repaint()
+                self._apply_terminal_state(view)
+                self._renderer.render(view.content, width, height, cursor=view.cursor)
+                self._painted_view = view
+        except BaseException as e:
+            # Surface the failure from run() once the loop has shut down
+            self._writer_error = e
+            self.quit()
+
+    def _apply_terminal_state(self, view: View) -> None:
+        """Diff View terminal fields against the last painted frame and emit changes."""
+        prev = self._painted_view
         buf = ''
         # Alt screen toggle
         if prev is not None and view.alt_screen != prev.alt_screen:
@@ -258,7 +450,6 @@ class Program:
 
             # Force repaint and get new size
             self._width, self._height = terminal.get_size()
-            self._renderer.repaint()
             self._queue.put(WindowSizeMsg(self._width, self._height))
 
         signal.signal(signal.SIGTSTP, on_suspend)
@@ -271,3 +462,13 @@ class Program:
     def quit(self) -> None:
         """Signal the program to quit."""
         self._quit = True
+        # Wake the main loop, which blocks on the queue
+        self._queue.put(QuitMsg())
+
+
+_MSG_HOOKS: dict[type, Callable[[Program, Msg], bool]] = {
+    _InputBurst: Program._on_burst,
+    QuitMsg: Program._on_quit,
+    keys.KeyMsg: Program._on_key,
+    WindowSizeMsg: Program._on_window_size,
+}
@@ -6,12 +6,16 @@ Supports hardware cursor positioning from View.cursor.
 
 from __future__ import annotations
 
-import os
 import sys
+from functools import lru_cache
 
 from . import terminal
 from . import strutil
 
+# Changed lines often recur (toggling cursor rows, alternating status text);
+# keep their width-fitted form
+_truncate = lru_cache(maxsize=512)(strutil.truncate)
+
 
 class Renderer:
     """Efficient line-diff renderer that only updates changed lines."""
@@ -20,6 +24,8 @@ class Renderer:
         self._prev_lines: list[str] = []
         self._fd = sys.stdout.fileno()
         self._repaint = False
+        # (output, width, height, cursor) of the last frame written
+        self._last_frame: tuple = ()
 
     def repaint(self) -> None:
         """Force full repaint on next render (no screen clear)."""
@@ -34,36 +40,41 @@ class Renderer:
         cursor: tuple[int, int] | None = None,
     ) -> None:
         """Render output string to terminal, only updating changed lines."""
+        frame = (output, width, height, cursor)
+        if not self._repaint and frame == self._last_frame:
+            # Nothing on screen would change
+            return
+        self._last_frame = frame
         new_lines = output.split('\n')
 
         # Truncate to terminal height
         if len(new_lines) > height:
             new_lines = new_lines[:height]
 
-        buf: list[str] = [terminal.CURSOR_HOME]
+        # The whole frame, sync markers included, goes out in one write
+        buf: list[str] = [terminal.SYNC_BEGIN, terminal.CURSOR_HOME]
 
-        max_lines = max(len(new_lines), len(self._prev_lines))
+        prev = self._prev_lines
+        max_lines = max(len(new_lines), len(prev))
+        n = max(0, min(max_lines, height))
         repaint = self._repaint
         self._repaint = False
 
-        for i in range(max_lines):
-            if i >= height:
-                break
-
-            new = new_lines[i] if i < len(new_lines) else ''
-            old = self._prev_lines[i] if i < len(self._prev_lines) else None
-
-            if not repaint and old is not None and old == new:
-                # Line unchanged — just move cursor down
-                if i < max_lines - 1:
-                    buf.append('\r\n')
-                continue
-
-            # Truncate line to terminal width
-            truncated = strutil.truncate(new, width)
-            buf.append(truncated + terminal.ERASE_LINE_RIGHT)
-            if i < max_lines - 1:
-                buf.append('\r\n')
+        # Line i of the new frame against line i of the old one. Lines past
+        # the new frame's end are blanked; lines past the old one's always draw
+        news = new_lines if len(new_lines) >= n else new_lines + [''] * (n - len(new_lines))
+        olds = prev if len(prev) >= n else prev + [None] * (n - len(prev))
+        erase = terminal.ERASE_LINE_RIGHT
+        truncate = _truncate
+        if repaint:
+            rows = [truncate(new, width) + erase for new in news[:n]]
+        else:
+            # Unchanged lines stay empty, so the join just moves the cursor down
+            rows = ['' if new == old else truncate(new, width) + erase
+                    for new, old in zip(news[:n], olds)]
+        buf.append('\r\n'.join(rows))
+        if 0 < n < max_lines:
+            buf.append('\r\n')
 
         # Clear any leftover lines from previous render
         if len(self._prev_lines) > len(new_lines):
@@ -77,12 +88,13 @@ class Renderer:
         else:
             buf.append(terminal.HIDE_CURSOR)
 
-        frame = ''.join(buf)
-        os.write(self._fd, (terminal.SYNC_BEGIN + frame + terminal.SYNC_END).encode())
+        buf.append(terminal.SYNC_END)
+        terminal.write_all(self._fd, ''.join(buf).encode())
 
         self._prev_lines = new_lines
 
     def clear(self) -> None:
         """Clear the screen and reset state."""
         self._prev_lines = []
-        os.write(self._fd, (terminal.ERASE_ENTIRE_SCREEN + terminal.CURSOR_HOME).encode())
+        self._last_frame = ()
+        terminal.write_all(self._fd, (terminal.ERASE_ENTIRE_SCREEN + terminal.CURSOR_HOME).encode())
@@ -4,18 +4,27 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 
 # Matches any ANSI escape sequence (CSI, OSC, etc.)
 _ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|\x1b\][^\x07]*\x07|\x1b[()][AB012]|\x1b\[[\d;]*m')
+# Same, capturing: split() alternates plain text (even) and escapes (odd)
+_ANSI_SPLIT_RE = re.compile(f'({_ANSI_RE.pattern})')
 
 
 def strip_ansi(s: str) -> str:
     """Remove all ANSI escape sequences from a string."""
+    # Every sequence starts with ESC; the membership test is a C-level scan
+    if '\x1b' not in s:
+        return s
     return _ANSI_RE.sub('', s)
 
 
-def _char_width(ch: str) -> int:
-    """Width of a single character (2 for CJK wide, 0 for combining, 1 otherwise)."""
+# Per-character width, filled on first sight of each character
+_WIDTH_CACHE: dict[str, int] = {}
+
+
+def _compute_char_width(ch: str) -> int:
     cat = unicodedata.category(ch)
     if cat.startswith('M'):  # combining marks
         return 0
@@ -25,20 +34,94 @@ def _char_width(ch: str) -> int:
     return 1
 
 
+def _char_width(ch: str) -> int:
+    """Width of a single character (2 for CJK wide, 0 for combining, 1 otherwise)."""
+    w = _WIDTH_CACHE.get(ch)
+    if w is None:
+        w = _WIDTH_CACHE[ch] = _compute_char_width(ch)
+    return w
+
+
 def visible_width(s: str) -> int:
     """Visible width of a string after stripping ANSI escapes, handling CJK."""
-    plain = strip_ansi(s)
-    return sum(_char_width(ch) for ch in plain)
+    plain = _ANSI_RE.sub('', s) if '\x1b' in s else s
+    # Every ASCII character is one column wide
+    if plain.isascii():
+        return len(plain)
+    # Sum cached widths with a C-level map(); the Python loop only runs the
+    # first time a character is seen
+    cache = _WIDTH_CACHE
+    try:
+        return sum(map(cache.__getitem__, plain))
+    except KeyError:
+        for ch in set(plain).difference(cache):
+            cache[ch] = _compute_char_width(ch)
+        return sum(map(cache.__getitem__, plain))
+
+
+# Tables, help bars, panels and prompts re-measure the same strings every
+# frame, so they share this one memoized copy
+cached_visible_width = lru_cache(maxsize=8192)(visible_width)
+
+
+def _prefix_fit(text: str, budget: int) -> tuple[int, int]:
+    """Longest prefix of escape-free text that fits in budget columns.
+
+    Returns (chars, width) for text[:chars].
+    """
+    if text.isascii():
+        n = min(len(text), max(budget, 0))
+        return n, n
+    w = 0
+    for j, ch in enumerate(text):
+        cw = _char_width(ch)
+        if w + cw > budget:
+            return j, w
+        w += cw
+    return len(text), w
 
 
 def pad_right(s: str, width: int) -> str:
     """Pad string with spaces to reach target visible width."""
+    # Plain ASCII is one column per character, so str.ljust does it in C
+    if s.isascii() and '\x1b' not in s:
+        return s.ljust(width)
     vw = visible_width(s)
     if vw >= width:
         return s
     return s + ' ' * (width - vw)
 
 
+def fit_width(s: str, width: int) -> str:
+    """Truncate or pad a string to exactly `width` visible columns.
+
+    Same result as pad_right(truncate(s, width), width), but in one pass.
+    """
+    if width <= 0:
+        return ''
+
+    # Plain ASCII: every character is one column
+    if s.isascii() and '\x1b' not in s:
+        return s[:width].ljust(width)
+
+    result: list[str] = []
+    current_width = 0
+
+    for k, part in enumerate(_ANSI_SPLIT_RE.split(s)):
+        if k & 1:
+            result.append(part)
+            continue
+        n, w = _prefix_fit(part, width - current_width)
+        current_width += w
+        if n < len(part):
+            result.append(part[:n])
+            return ''.join(result) + ' ' * (width - current_width)
+        result.append(part)
+
+    # Never overflowed: keep the original string (and any trailing escapes)
+    return s + ' ' * (width - current_width)
+
+
 def truncate(s: str, width: int, tail: str = '') -> str:
     """Truncate string to fit within visible width, preserving ANSI sequences.
 
@@ -54,6 +137,23 @@ def truncate(s: str, width: int, tail: str = '') -> str:
     if width <= 0:
         return ''
 
+    if s.isascii():
+        # Escapes take no columns, so an ASCII string no longer than width
+        # fits whether or not it is styled
+        if len(s) <= width:
+            return s
+        # Plain ASCII: width is length, so slicing is exact
+        if '\x1b' not in s:
+            if not tail:
+                return s[:width]
+            content_width = width - visible_width(tail)
+            if content_width <= 0:
+                return tail[:width]
+            return s[:content_width] + tail
+    elif len(s) * 2 <= width:
+        # No character is wider than two columns
+        return s
+
     vw = visible_width(s)
     if vw <= width:
         return s
@@ -65,24 +165,16 @@ def truncate(s: str, width: int, tail: str = '') -> str:
 
     result: list[str] = []
     current_width = 0
-    i = 0
-    n = len(s)
-
-    while i < n:
-        # Check for ANSI escape sequence
-        m = _ANSI_RE.match(s, i)
-        if m:
-            result.append(m.group())
-            i = m.end()
-            continue
 
-        ch = s[i]
-        cw = _char_width(ch)
-        if current_width + cw > content_width:
+    for k, part in enumerate(_ANSI_SPLIT_RE.split(s)):
+        if k & 1:
+            result.append(part)
+            continue
+        n, w = _prefix_fit(part, content_width - current_width)
+        result.append(part[:n])
+        current_width += w
+        if n < len(part):
             break
-        result.append(ch)
-        current_width += cw
-        i += 1
 
     if tail:
         result.append(tail)
@@ -97,6 +189,16 @@ def word_wrap(s: str, width: int) -> str:
     """
     if width <= 0:
         return s
+    return '\n'.join(word_wrap_lines(s, width))
+
+
+def word_wrap_lines(s: str, width: int) -> list[str]:
+    """Like word_wrap(), but return the wrapped lines as a list.
+
+    Saves callers that need lines the join/split round-trip.
+    """
+    if width <= 0:
+        return s.split('\n')
 
     lines = s.split('\n')
     wrapped: list[str] = []
@@ -112,139 +214,126 @@ def word_wrap(s: str, width: int) -> str:
         # Track active ANSI styling to reapply after wraps
         active_ansi: list[str] = []
 
-        words = _split_words_ansi(line)
-        for word in words:
-            ww = visible_width(word)
+        for word, ww, escapes in _split_words_ansi(line):
+            if current_width and current_width + ww <= width:
+                current_line.append(word)
+                current_width += ww
+            else:
+                if current_width:
+                    # Wrap
+                    wrapped.append(''.join(current_line))
+                    current_line = list(active_ansi)
+                    if ww <= width:
+                        # Skip leading space on new line
+                        stripped = word.lstrip(' ')
+                        ww -= len(word) - len(stripped)
+                        word = stripped
 
-            if current_width == 0:
-                # Start of line — always take the word
                 if ww > width:
                     # Word itself is too long, hard-break it
-                    pieces = _hard_break(word, width)
+                    pieces, last_width, last_blank = _hard_break(word, width)
                     for j, piece in enumerate(pieces):
                         if j > 0:
                             wrapped.append(''.join(current_line))
                             current_line = list(active_ansi)
                         current_line.append(piece)
                     # Drop trailing whitespace-only piece (avoids blank lines)
-                    if pieces and strip_ansi(pieces[-1]).strip() == '':
+                    if last_blank:
                         current_line = list(active_ansi)
                         current_width = 0
                     else:
-                        current_width = visible_width(pieces[-1]) if pieces else 0
+                        current_width = last_width
                 else:
                     current_line.append(word)
                     current_width = ww
-                # Track ANSI in this word
-                for m in _ANSI_RE.finditer(word):
-                    seq = m.group()
-                    if seq == '\x1b[0m':
-                        active_ansi.clear()
-                    else:
-                        active_ansi.append(seq)
-            elif current_width + ww <= width:
-                current_line.append(word)
-                current_width += ww
-                for m in _ANSI_RE.finditer(word):
-                    seq = m.group()
-                    if seq == '\x1b[0m':
-                        active_ansi.clear()
-                    else:
-                        active_ansi.append(seq)
-            else:
-                # Wrap
-                wrapped.append(''.join(current_line))
-                current_line = list(active_ansi)
-                if ww > width:
-                    pieces = _hard_break(word, width)
-                    for j, piece in enumerate(pieces):
-                        if j > 0:
-                            wrapped.append(''.join(current_line))
-                            current_line = list(active_ansi)
-                        current_line.append(piece)
-                    # Drop trailing whitespace-only piece
-                    if pieces and strip_ansi(pieces[-1]).strip() == '':
-                        current_line = list(active_ansi)
-                        current_width = 0
-                    else:
-                        current_width = visible_width(pieces[-1]) if pieces else 0
+
+            # Track ANSI in this word
+            for seq in escapes:
+                if seq == '\x1b[0m':
+                    active_ansi.clear()
                 else:
-                    # Skip leading space on new line
-                    stripped = word.lstrip(' ')
-                    current_line.append(stripped)
-                    current_width = visible_width(stripped)
-                for m in _ANSI_RE.finditer(word):
-                    seq = m.group()
-                    if seq == '\x1b[0m':
-                        active_ansi.clear()
-                    else:
-                        active_ansi.append(seq)
+                    active_ansi.append(seq)
 
         if current_line:
             wrapped.append(''.join(current_line))
 
-    return '\n'.join(wrapped)
+    return wrapped
 
 
-def _split_words_ansi(s: str) -> list[str]:
-    """Split string into words preserving spaces and ANSI sequences attached to words."""
-    tokens: list[str] = []
-    current: list[str] = []
-    i = 0
-    n = len(s)
-
-    while i < n:
-        m = _ANSI_RE.match(s, i)
-        if m:
-            current.append(m.group())
-            i = m.end()
-            continue
+# A word with its trailing spaces, or a run of leading spaces
+_WORD_RE = re.compile(r'[^ ]* +|[^ ]+')
 
-        ch = s[i]
-        if ch == ' ':
-            current.append(ch)
-            # Space is part of "word" boundary — if next char is non-space, flush
-            if i + 1 < n:
-                m2 = _ANSI_RE.match(s, i + 1)
-                next_ch = s[m2.end()] if m2 and m2.end() < n else (s[i + 1] if i + 1 < n else ' ')
-                if next_ch != ' ':
-                    tokens.append(''.join(current))
-                    current = []
-            i += 1
-        else:
-            current.append(ch)
-            i += 1
+
+def _split_words_ansi(s: str) -> list[tuple[str, int, list[str]]]:
+    """Split string into words preserving spaces and ANSI sequences attached to words.
+
+    Returns (word, visible width, escape sequences in word) triples, all
+    gathered in the same pass so wrapping never rescans a word.
+    """
+    tokens: list[tuple[str, int, list[str]]] = []
+    current: list[str] = []
+    current_width = 0
+    escapes: list[str] = []
+    parts = _ANSI_SPLIT_RE.split(s)
+    last = len(parts) - 1
+
+    for k in range(0, len(parts), 2):
+        if k:
+            current.append(parts[k - 1])
+            escapes.append(parts[k - 1])
+        segments = _WORD_RE.findall(parts[k])
+        final = len(segments) - 1
+        for j, seg in enumerate(segments):
+            current.append(seg)
+            current_width += len(seg) if seg.isascii() else visible_width(seg)
+            if seg[-1] != ' ':
+                continue
+            # Space is part of "word" boundary — if next char (looking past
+            # one escape) is non-space, flush
+            if j < final:
+                flush = True
+            elif k < last:
+                flush = not parts[k + 2].startswith(' ')
+            else:
+                flush = False
+            if flush:
+                tokens.append((''.join(current), current_width, escapes))
+                current = []
+                current_width = 0
+                escapes = []
 
     if current:
-        tokens.append(''.join(current))
+        tokens.append((''.join(current), current_width, escapes))
     return tokens
 
 
-def _hard_break(word: str, width: int) -> list[str]:
-    """Break a single word that exceeds width into pieces."""
+def _hard_break(word: str, width: int) -> tuple[list[str], int, bool]:
+    """Break a single word that exceeds width into pieces.
+
+    Returns (pieces, width of the last piece, whether the last piece is
+    whitespace apart from escapes).
+    """
     pieces: list[str] = []
     current: list[str] = []
     current_width = 0
-    i = 0
-    n = len(word)
-
-    while i < n:
-        m = _ANSI_RE.match(word, i)
-        if m:
-            current.append(m.group())
-            i = m.end()
-            continue
+    blank = True
 
-        ch = word[i]
-        cw = _char_width(ch)
-        if current_width + cw > width and current:
-            pieces.append(''.join(current))
-            current = []
-            current_width = 0
-        current.append(ch)
-        current_width += cw
-        i += 1
+    for k, part in enumerate(_ANSI_SPLIT_RE.split(word)):
+        if k & 1:
+            current.append(part)
+            continue
+        for ch in part:
+            cw = _char_width(ch)
+            if current_width + cw > width and current:
+                pieces.append(''.join(current))
+                current = []
+                current_width = 0
+                blank = True
+            current.append(ch)
+            current_width += cw
+            if blank and not ch.isspace():
+                blank = False
 
     if current:
         pieces.append(''.join(current))
-    return pieces
+    return pieces, current_width, blank
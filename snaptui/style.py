@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from . import strutil
 
@@ -35,17 +36,22 @@ NO_BORDER = None
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Apps use a handful of theme colors, so the color-code builders are memoized
+
+@lru_cache(maxsize=256)
 def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert '#RRGGBB' or 'RRGGBB' to (r, g, b)."""
     h = hex_color.lstrip('#')
     return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
 
 
+@lru_cache(maxsize=256)
 def _fg_code(hex_color: str) -> str:
     r, g, b = _hex_to_rgb(hex_color)
     return f'\x1b[38;2;{r};{g};{b}m'
 
 
+@lru_cache(maxsize=256)
 def _bg_code(hex_color: str) -> str:
     r, g, b = _hex_to_rgb(hex_color)
     return f'\x1b[48;2;{r};{g};{b}m'
@@ -76,12 +82,19 @@ _UNDERLINE_SGR: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def _underline_color_code(hex_color: str) -> str:
     """SGR 58;2;r;g;b — set underline color (24-bit)."""
     r, g, b = _hex_to_rgb(hex_color)
     return f'\x1b[58;2;{r};{g};{b}m'
 
 
+@lru_cache(maxsize=256)
+def _border_row(left: str, fill: str, right: str, width: int, fg_code: str) -> str:
+    """Top or bottom border line; panels redraw the same ones every frame."""
+    return fg_code + left + fill * width + right + (RESET if fg_code else '')
+
+
 # ── Style class ───────────────────────────────────────────────────────────────
 
 class Style:
@@ -97,6 +110,9 @@ class Style:
         '_border', '_border_fg_color',
         '_border_top', '_border_right', '_border_bottom', '_border_left',
         '_align',
+        # Memoized on first render; reset by _copy()
+        '_prefix',  # _build_prefix() result
+        '_simple',  # _is_simple() result
     )
 
     def __init__(self) -> None:
@@ -129,11 +145,45 @@ class Style:
         self._border_bottom: bool = True
         self._border_left: bool = True
         self._align: float = 0.0  # 0=left, 0.5=center, 1=right
+        self._prefix: str | None = None
+        self._simple: bool | None = None
 
     def _copy(self) -> Style:
+        # Spelled out field by field: a getattr/setattr walk over __slots__
+        # costs ~5x more, and every builder call in a chain goes through here.
         new = Style.__new__(Style)
-        for slot in Style.__slots__:
-            setattr(new, slot, getattr(self, slot))
+        new._fg_color = self._fg_color
+        new._bg_color = self._bg_color
+        new._bold = self._bold
+        new._dim = self._dim
+        new._italic = self._italic
+        new._underline = self._underline
+        new._underline_style = self._underline_style
+        new._underline_color = self._underline_color
+        new._reverse = self._reverse
+        new._strikethrough = self._strikethrough
+        new._padding_top = self._padding_top
+        new._padding_right = self._padding_right
+        new._padding_bottom = self._padding_bottom
+        new._padding_left = self._padding_left
+        new._margin_top = self._margin_top
+        new._margin_right = self._margin_right
+        new._margin_bottom = self._margin_bottom
+        new._margin_left = self._margin_left
+        new._width = self._width
+        new._max_width = self._max_width
+        new._height = self._height
+        new._max_height = self._max_height
+        new._border = self._border
+        new._border_fg_color = self._border_fg_color
+        new._border_top = self._border_top
+        new._border_right = self._border_right
+        new._border_bottom = self._border_bottom
+        new._border_left = self._border_left
+        new._align = self._align
+        # The copy is about to be modified
+        new._prefix = None
+        new._simple = None
         return new
 
     # ── Text attributes ───────────────────────────────────────────────────
@@ -292,28 +342,23 @@ class Style:
 
     def render(self, content: str) -> str:
         """Apply all styling and return the final ANSI string."""
+        simple = self._simple
+        if simple is None:
+            simple = self._simple = self._is_simple()
+        if simple and '\n' not in content:
+            # A single line with no layout only needs its SGR wrapper
+            prefix = self._build_prefix()
+            return prefix + content + RESET if prefix else content
+        return _cached_render_layout(self, content)
+
+    def _render_layout(self, content: str) -> str:
         lines = content.split('\n')
 
         # Wrap before padding so wrapped lines all get proper padding
-        lines = self._apply_wrap(lines)
-
-        # Apply padding (plain spaces — will be inside ANSI wrapper)
-        lines = self._apply_padding(lines)
-
-        # Apply width constraint (pad/safety-truncate; wrapping already handled)
-        lines = self._apply_width(lines)
+        lines, widths = self._apply_wrap(lines)
 
-        # Apply height constraint
-        lines = self._apply_height(lines)
-
-        # Apply alignment within width
-        lines = self._apply_align(lines)
-
-        # Pad all lines to the max width so background fills uniformly
-        # (matches Go lipgloss which always normalizes line widths)
-        if len(lines) > 1:
-            max_w = max((strutil.visible_width(l) for l in lines), default=0)
-            lines = [strutil.pad_right(l, max_w) for l in lines]
+        # Padding, width, height, alignment and width normalization
+        lines = self._apply_box(lines, widths)
 
         # Apply ANSI text styling AFTER padding/width/height/alignment
         # so padding spaces get the background color (matches Go lipgloss)
@@ -338,7 +383,25 @@ class Style:
 
         return '\n'.join(lines)
 
+    def _is_simple(self) -> bool:
+        """True if single-line content renders as just prefix + text + reset."""
+        return not (
+            self._width or self._max_width or self._height
+            or self._padding_top or self._padding_right
+            or self._padding_bottom or self._padding_left
+            or self._margin_top or self._margin_right
+            or self._margin_bottom or self._margin_left
+            or self._border
+        )
+
     def _build_prefix(self) -> str:
+        # Styles never change after a builder call returns, so compute once
+        prefix = self._prefix
+        if prefix is None:
+            prefix = self._prefix = self._compute_prefix()
+        return prefix
+
+    def _compute_prefix(self) -> str:
         parts: list[str] = []
         if self._bold:
             parts.append(BOLD_CODE)
@@ -363,10 +426,16 @@ class Style:
             parts.append(_bg_code(self._bg_color))
         return ''.join(parts)
 
-    def _apply_wrap(self, lines: list[str]) -> list[str]:
-        """Wrap lines to fit within width minus padding/border chrome."""
+    def _apply_wrap(self, lines: list[str]) -> tuple[list[str], list[int]]:
+        """Wrap lines to fit within width minus padding/border chrome.
+
+        Returns the lines with their visible widths, so later stages never
+        measure them again.
+        """
+        visible_width = strutil.cached_visible_width
+        widths = [visible_width(line) for line in lines]
         if self._width <= 0:
-            return lines
+            return lines, widths
         # Content width = total width - padding - border
         content_w = self._width - self._padding_left - self._padding_right
         if self._border:
@@ -374,88 +443,97 @@ class Style:
                 content_w -= 1
             if self._border_right:
                 content_w -= 1
-        if content_w <= 0:
-            return lines
+        if content_w <= 0 or max(widths) <= content_w:
+            return lines, widths
+        # Only hand the long lines to the wrapper
         result: list[str] = []
-        for line in lines:
-            wrapped = strutil.word_wrap(line, content_w)
-            result.extend(wrapped.split('\n'))
-        return result
-
-    def _apply_padding(self, lines: list[str]) -> list[str]:
-        result = lines
-        if self._padding_left > 0 or self._padding_right > 0:
-            left = ' ' * self._padding_left
-            right = ' ' * self._padding_right
-            result = [left + line + right for line in result]
-        if self._padding_top > 0:
-            # Determine line width for blank padding lines
-            w = max((strutil.visible_width(l) for l in result), default=0) if result else 0
-            blank = ' ' * w
-            result = [blank] * self._padding_top + result
-        if self._padding_bottom > 0:
-            w = max((strutil.visible_width(l) for l in result), default=0) if result else 0
-            blank = ' ' * w
-            result = result + [blank] * self._padding_bottom
-        return result
-
-    def _apply_width(self, lines: list[str]) -> list[str]:
-        if self._width <= 0:
-            return lines
-        # Target is the inner content width (width minus border)
-        target = self._width
-        if self._border:
-            bw = 0
-            if self._border_left:
-                bw += 1
-            if self._border_right:
-                bw += 1
-            target = max(target - bw, 0)
-        result: list[str] = []
-        for line in lines:
-            vw = strutil.visible_width(line)
-            if vw < target:
-                result.append(strutil.pad_right(line, target))
-            elif vw > target:
-                # Safety truncate — wrapping should have handled this
-                result.append(strutil.truncate(line, target))
-            else:
-                result.append(line)
-        return result
-
-    def _apply_height(self, lines: list[str]) -> list[str]:
-        if self._height <= 0:
-            return lines
-        target = self._height
-        if self._border:
-            bh = 0
-            if self._border_top:
-                bh += 1
-            if self._border_bottom:
-                bh += 1
-            target = max(target - bh, 0)
-        if len(lines) < target:
-            w = max((strutil.visible_width(l) for l in lines), default=0) if lines else 0
-            blank = ' ' * w
-            lines = lines + [blank] * (target - len(lines))
-        elif len(lines) > target:
-            lines = lines[:target]
-        return lines
-
-    def _apply_align(self, lines: list[str]) -> list[str]:
-        if self._align == 0.0:
-            return lines
-        # Find max width
-        max_w = max((strutil.visible_width(l) for l in lines), default=0)
-        result: list[str] = []
-        for line in lines:
-            vw = strutil.visible_width(line)
-            gap = max_w - vw
-            if gap <= 0:
+        result_widths: list[int] = []
+        for line, w in zip(lines, widths):
+            if w <= content_w:
                 result.append(line)
+                result_widths.append(w)
             else:
-                left_pad = int(gap * self._align)
-                result.append(' ' * left_pad + line + ' ' * (gap - left_pad))
+                wrapped = strutil.word_wrap_lines(line, content_w)
+                result.extend(wrapped)
+                result_widths.extend(map(visible_width, wrapped))
+        return result, result_widths
+
+    def _apply_box(self, lines: list[str], text_widths: list[int]) -> list[str]:
+        """Pad, size and align lines, normalizing them to one width.
+
+        `text_widths` are the visible widths of `lines`. Padding and alignment
+        spaces are added in a single concatenation per row. Blank rows
+        (vertical padding and height fill) always come out as plain spaces
+        of the final width.
+        """
+        pl = self._padding_left
+        pr = self._padding_right
+        if pl > 0 or pr > 0:
+            left = ' ' * pl
+            right = ' ' * pr
+            lines = [left + line + right for line in lines]
+            actual = [w + pl + pr for w in text_widths]
+        else:
+            lines = list(lines)
+            actual = list(text_widths)
+
+        # actual: width of each row's text; widths: width after sizing
+        visible_width = strutil.cached_visible_width
+        if self._width > 0:
+            # Target is the inner content width (width minus border)
+            target = self._width
+            if self._border:
+                target -= self._border_left + self._border_right
+            target = max(target, 0)
+            widths = []
+            for i, w in enumerate(actual):
+                if w > target:
+                    # Safety truncate — wrapping should have handled this
+                    lines[i] = strutil.truncate(lines[i], target)
+                    w = actual[i] = visible_width(lines[i])
+                    widths.append(w)
+                else:
+                    widths.append(target)
+            blank_w = target
+        else:
+            widths = actual.copy()
+            blank_w = max(actual, default=0)
+
+        top = self._padding_top
+        bottom = self._padding_bottom
+        if top > 0 or bottom > 0:
+            lines = [''] * top + lines + [''] * bottom
+            actual = [0] * top + actual + [0] * bottom
+            widths = [blank_w] * top + widths + [blank_w] * bottom
+
+        if self._height > 0:
+            target = self._height
+            if self._border:
+                target -= self._border_top + self._border_bottom
+            target = max(target, 0)
+            if len(lines) < target:
+                fill = target - len(lines)
+                blank_w = max(widths, default=0)
+                lines += [''] * fill
+                actual += [0] * fill
+                widths += [blank_w] * fill
+            elif len(lines) > target:
+                del lines[target:], actual[target:], widths[target:]
+
+        # Every empty row comes out as the same run of spaces; share it
+        max_w = max(widths, default=0)
+        blank = ' ' * max_w
+        align = self._align
+        if align == 0.0:
+            return [line + ' ' * (max_w - w) if line else blank
+                    for line, w in zip(lines, actual)]
+        result: list[str] = []
+        for line, w, box_w in zip(lines, actual, widths):
+            if not line:
+                result.append(blank)
+                continue
+            left_pad = int((max_w - box_w) * align)
+            result.append(' ' * left_pad + line + ' ' * (max_w - w - left_pad))
         return result
 
     def _apply_border(self, lines: list[str]) -> list[str]:
@@ -463,8 +541,8 @@ class Style:
         if not b:
             return lines
 
-        # Determine content width
-        content_w = max((strutil.visible_width(l) for l in lines), default=0) if lines else 0
+        # render() hands over lines already normalized to one width
+        content_w = strutil.cached_visible_width(lines[0]) if lines else 0
 
         bfg = _fg_code(self._border_fg_color) if self._border_fg_color else ''
         breset = RESET if bfg else ''
@@ -475,34 +553,32 @@ class Style:
         if self._border_top:
             left = b.top_left if self._border_left else ''
             right = b.top_right if self._border_right else ''
-            top_line = bfg + left + b.horizontal * content_w + right + breset
-            result.append(top_line)
+            result.append(_border_row(left, b.horizontal, right, content_w, bfg))
 
         # Content lines with side borders
-        for line in lines:
-            vw = strutil.visible_width(line)
-            padded = line + ' ' * (content_w - vw)
-            left = bfg + b.vertical + breset if self._border_left else ''
-            right = bfg + b.vertical + breset if self._border_right else ''
-            result.append(left + padded + right)
+        side = bfg + b.vertical + breset
+        left = side if self._border_left else ''
+        right = side if self._border_right else ''
+        result.extend([left + line + right for line in lines])
 
         # Bottom border
         if self._border_bottom:
             left = b.bottom_left if self._border_left else ''
             right = b.bottom_right if self._border_right else ''
-            bottom_line = bfg + left + b.horizontal * content_w + right + breset
-            result.append(bottom_line)
+            result.append(_border_row(left, b.horizontal, right, content_w, bfg))
 
         return result
 
     def _apply_margin(self, lines: list[str]) -> list[str]:
-        result = lines
         if self._margin_left > 0 or self._margin_right > 0:
             left = ' ' * self._margin_left
             right = ' ' * self._margin_right
-            result = [left + line + right for line in result]
-        if self._margin_top > 0:
-            result = [''] * self._margin_top + result
-        if self._margin_bottom > 0:
-            result = result + [''] * self._margin_bottom
-        return result
+            lines = [left + line + right for line in lines]
+        if self._margin_top > 0 or self._margin_bottom > 0:
+            lines = [''] * self._margin_top + lines + [''] * self._margin_bottom
+        return lines
+
+
+# Styles are immutable and hash by identity, so (style, content) fully
+# determines the output; static panels hit this on every frame
+_cached_render_layout = lru_cache(maxsize=1024)(Style._render_layout)
@@ -127,13 +127,18 @@ def restore(fd: int, old_state: list) -> None:
 
 # ── Terminal size ─────────────────────────────────────────────────────────────
 
+# struct winsize is four shorts; only ws_row and ws_col are read
+_WINSIZE_BUF = bytes(8)
+_WINSIZE_ROWS_COLS = struct.Struct('HH')
+
+
 def get_size(fd: int | None = None) -> tuple[int, int]:
     """Returns (width, height) via TIOCGWINSZ ioctl."""
     if fd is None:
         fd = sys.stdout.fileno()
     try:
-        buf = fcntl.ioctl(fd, termios.TIOCGWINSZ, b'\x00' * 8)
-        rows, cols = struct.unpack('HHHH', buf)[:2]
+        buf = fcntl.ioctl(fd, termios.TIOCGWINSZ, _WINSIZE_BUF)
+        rows, cols = _WINSIZE_ROWS_COLS.unpack_from(buf)
         return cols, rows
     except OSError:
         return 80, 24  # fallback
@@ -152,10 +157,23 @@ def listen_for_resize(callback) -> None:
 # ── Output helpers ────────────────────────────────────────────────────────────
 
 def write(s: str) -> None:
-    """Write string to stdout and flush."""
-    os.write(sys.stdout.fileno(), s.encode())
+    """Write string to the stdout fd, bypassing sys.stdout buffering."""
+    write_all(sys.stdout.fileno(), s.encode())
 
 
 def write_bytes(b: bytes) -> None:
     """Write bytes to stdout fd."""
-    os.write(sys.stdout.fileno(), b)
+    write_all(sys.stdout.fileno(), b)
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd in as few syscalls as the kernel allows.
+
+    os.write may accept only part of a large buffer (e.g. a full-screen
+    frame on a slow pty); the remainder is written without copying.
+    """
+    n = os.write(fd, data)
+    if n < len(data):
+        view = memoryview(data)[n:]
+        while view:
+            view = view[os.write(fd, view):]
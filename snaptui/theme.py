@@ -7,6 +7,7 @@ AppTheme: app-level palette for titles, sections, borders, list items, etc.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .style import HIDDEN_BORDER, THICK_BORDER, ROUNDED_BORDER, DOUBLE_BORDER, Style
 
@@ -29,9 +30,11 @@ class Theme:
     blurred_base: Style | None = None     # Container style for blurred field
 
 
-def ThemeCharm() -> Theme:
-    """Return a Theme matching huh's ThemeCharm dark-mode palette."""
-    return Theme(
+# Styles are immutable, so every theme instance shares one set built on first
+# use. The Theme/AppTheme containers stay per-call because apps may edit them.
+@lru_cache(maxsize=None)
+def _charm_styles() -> dict:
+    return dict(
         title=Style().bold().fg("#7571F9"),
         cursor=Style().fg("#02BF87"),
         prompt=Style().fg("#F780E2"),
@@ -46,6 +49,11 @@ def ThemeCharm() -> Theme:
     )
 
 
+def ThemeCharm() -> Theme:
+    """Return a Theme matching huh's ThemeCharm dark-mode palette."""
+    return Theme(**_charm_styles())
+
+
 # ── App theme (snaptui-original) ─────────────────────────────────────────────
 
 @dataclass
@@ -82,11 +90,9 @@ class AppTheme:
     item_description: Style  # Secondary line under item
 
 
-def AppThemeCharm() -> AppTheme:
-    """Dark-mode palette used by gig_crm and parrhesia viewer."""
-    return AppTheme(
-        form=ThemeCharm(),
-
+@lru_cache(maxsize=None)
+def _app_charm_styles() -> dict:
+    return dict(
         title=Style().bold().fg("#FAFAFA").bg("#7D56F4").padding(0, 1),
         subtitle=Style().fg("#AFAFAF"),
         help=Style().fg("#626262"),
@@ -105,3 +111,8 @@ def AppThemeCharm() -> AppTheme:
         item_normal=Style().fg("#FAFAFA").padding(0, 1),
         item_description=Style().fg("#BBBBBB"),
     )
+
+
+def AppThemeCharm() -> AppTheme:
+    """Dark-mode palette used by gig_crm and parrhesia viewer."""
+    return AppTheme(form=ThemeCharm(), **_app_charm_styles())
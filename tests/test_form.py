@@ -0,0 +1,148 @@
+"""Tests for the Form component."""
+
+from snaptui.components.confirm import Confirm
+from snaptui.components.form import Form, FormField
+from snaptui.components.select import Select
+from snaptui.components.textinput import TextInput
+from snaptui.keys import KeyMsg
+
+
+def _form(n: int = 3) -> Form:
+    form = Form()
+    for i in range(n):
+        form.add_field(TextInput(), key=f'f{i}')
+    form.init()
+    return form
+
+
+def _focused(form: Form) -> list[int]:
+    return [i for i, f in enumerate(form.fields) if f.component.focused]
+
+
+class TestFormFocus:
+    def test_init_focuses_first_field(self):
+        form = _form()
+        assert form.focused_index == 0
+        assert _focused(form) == [0]
+
+    def test_tab_and_shift_tab_wrap(self):
+        form = _form()
+        form.update(KeyMsg('tab'))
+        assert _focused(form) == [1]
+        form.update(KeyMsg('shift+tab'))
+        form.update(KeyMsg('shift+tab'))
+        assert form.focused_index == 2
+        assert _focused(form) == [2]
+
+    def test_focus_field_clamps_index(self):
+        form = _form()
+        form.focus_field(10)
+        assert _focused(form) == [2]
+        form.focus_field(-4)
+        assert _focused(form) == [0]
+
+    def test_next_field_after_removing_focused_field(self):
+        form = _form()
+        form.focus_field(2)
+        form.fields.pop()
+        form.next_field()
+        assert form.focused_index == 1
+        assert _focused(form) == [1]
+
+    def test_focus_field_after_removing_focused_field(self):
+        form = _form()
+        form.focus_field(2)
+        form.fields.pop()
+        form.focus_field(0)
+        assert _focused(form) == [0]
+
+    def test_navigation_on_empty_form_is_noop(self):
+        form = Form()
+        form.init()
+        form.next_field()
+        form.prev_field()
+        form.focus_field(3)
+        assert form.focused_index == 0
+
+
+class TestFormValues:
+    def test_typing_goes_to_focused_field(self):
+        form = _form(2)
+        form.update(KeyMsg('a', 'a'))
+        form.update(KeyMsg('tab'))
+        form.update(KeyMsg('b', 'b'))
+        assert form.get_values() == {'f0': 'a', 'f1': 'b'}
+        assert form.get_value('f1') == 'b'
+        assert form.get_value('missing') is None
+
+    def test_values_follow_added_fields(self):
+        form = _form(1)
+        assert form.get_values() == {'f0': ''}
+        form.add_field(Confirm(value=True), key='ok')
+        assert form.get_values() == {'f0': '', 'ok': True}
+
+    def test_replaced_field_is_indexed(self):
+        form = _form(2)
+        assert form.get_value('f1') == ''
+        form.fields[1] = FormField(TextInput(value='zz'), 'c')
+        assert form.get_value('c') == 'zz'
+        assert form.get_value('f1') is None
+        assert form.get_values() == {'f0': '', 'c': 'zz'}
+
+    def test_renamed_field_is_indexed(self):
+        form = _form(2)
+        assert form.get_values() == {'f0': '', 'f1': ''}
+        form.fields[1].key = 'c'
+        assert form.get_value('c') == ''
+        assert form.get_values() == {'f0': '', 'c': ''}
+
+    def test_get_value_skips_same_key_field_without_value(self):
+        class Note:
+            def view(self):
+                return 'note'
+
+        form = Form()
+        form.fields.append(FormField(Note(), 'k'))
+        form.add_field(TextInput(value='v'), key='k')
+        assert form.get_value('k') == 'v'
+
+    def test_enter_on_last_field_submits(self):
+        form = Form()
+        form.add_field(TextInput(), key='name')
+        form.add_field(Select(options=['a', 'b']), key='pick')
+        form.init()
+        form.update(KeyMsg('enter'))
+        assert form.focused_index == 1
+        assert not form.submitted
+        form.update(KeyMsg('down'))
+        form.update(KeyMsg('enter'))
+        assert form.submitted
+        assert form.get_value('pick') == 'b'
+
+    def test_esc_cancels(self):
+        form = _form()
+        form.update(KeyMsg('esc'))
+        assert form.cancelled
+
+
+class TestFormView:
+    def test_refresh_picks_up_direct_component_change(self):
+        form = _form(2)
+        form.view()
+        form.fields[1].component.set_value('changed')
+        form.refresh()
+        assert 'changed' in form.view()
+
+    def test_focus_index_change_restyles_fields(self):
+        form = _form(2)
+        before = form.view()
+        form.focused_index = 1
+        assert form.view() != before
+
+    def test_theme_change_restyles_fields(self):
+        form = _form(2)
+        themed = form.view()
+        form.theme = None
+        plain = form.view()
+        assert plain != themed
+        assert plain == form.fields[0].component.view() + '\n\n' + form.fields[1].component.view()
@@ -57,6 +57,13 @@ class TestHelpShort:
         assert "q" in result
 
 
+    def test_fills_width_exactly(self):
+        bindings = [KeyBinding(k, "x") for k in "abcde"]
+        result = Help(bindings=bindings, width=13).short_help()
+        assert visible_width(result) == 13
+        assert "c" in result and "d" not in result
+
+
 class TestHelpFull:
     def test_empty(self):
         h = Help(bindings=[])
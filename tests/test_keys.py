@@ -1,7 +1,8 @@
 """Tests for keys module — escape sequence parsing."""
 
-from snaptui.keys import KeyMsg, SEQUENCES, CTRL_MAP, _read_utf8
+from snaptui.keys import KeyMsg, FocusMsg, MouseMsg, SEQUENCES, CTRL_MAP, _read_utf8, read_key, read_keys
 import io
+import os
 
 
 class TestKeyMsg:
@@ -62,3 +63,100 @@ class TestCtrlMap:
 
     def test_ctrl_s(self):
         assert CTRL_MAP[19] == 'ctrl+s'
+
+
+class TestReadKey:
+    def _read(self, data: bytes):
+        r, w = os.pipe()
+        os.write(w, data)
+        os.close(w)
+        try:
+            return read_key(r, timeout=0.1)
+        finally:
+            os.close(r)
+
+    def test_arrow(self):
+        assert self._read(b'\x1b[A').key == 'up'
+
+    def test_ctrl_arrow(self):
+        msg = self._read(b'\x1b[1;5C')
+        assert msg.key == 'ctrl+right'
+        assert msg.has_ctrl
+
+    def test_ss3_function_key(self):
+        assert self._read(b'\x1bOP').key == 'f1'
+
+    def test_focus_events(self):
+        assert self._read(b'\x1b[I') == FocusMsg(focused=True)
+        assert self._read(b'\x1b[O') == FocusMsg(focused=False)
+
+    def test_unknown_csi(self):
+        assert self._read(b'\x1b[99X').key == "unknown(b'\\x1b[99X')"
+
+    def test_esc_alone(self):
+        assert self._read(b'\x1b').key == 'esc'
+
+    def test_alt_key(self):
+        msg = self._read(b'\x1bx')
+        assert msg.key == 'alt+x'
+        assert msg.has_alt
+
+    def test_alt_non_ascii_key(self):
+        msg = self._read('\x1bé'.encode())
+        assert msg.key == 'alt+é'
+        assert msg.char == 'é'
+        assert msg.has_alt
+        assert self._read('\x1b日'.encode()).key == 'alt+日'
+
+    def test_alt_non_ascii_key_is_one_message(self):
+        r, w = os.pipe()
+        os.write(w, '\x1b日q'.encode())
+        os.close(w)
+        try:
+            assert [m.key for m in read_keys(r, timeout=0.1)] == ['alt+日', 'q']
+        finally:
+            os.close(r)
+
+    def test_printable(self):
+        msg = self._read(b'q')
+        assert msg.key == 'q'
+        assert msg.char == 'q'
+
+    def test_single_byte_keys_are_shared(self):
+        assert self._read(b'q') is self._read(b'q')
+        space = self._read(b' ')
+        assert space.key == 'space' and space.char == ' '
+        ctrl_c = self._read(b'\x03')
+        assert ctrl_c == 'ctrl+c' and ctrl_c.has_ctrl
+
+    def test_utf8(self):
+        assert self._read('é'.encode()).char == 'é'
+
+    def test_burst_is_split_into_keys(self):
+        r, w = os.pipe()
+        os.write(w, b'\x1b[A\x1b[Bq\x1bx')
+        os.close(w)
+        try:
+            keys = []
+            while (msg := read_key(r, timeout=0.05)) is not None:
+                keys.append(msg.key)
+        finally:
+            os.close(r)
+        assert keys == ['up', 'down', 'q', 'alt+x']
+
+    def test_read_keys_returns_whole_burst(self):
+        r, w = os.pipe()
+        os.write(w, b'ab\x1b[C' + b'x' * 5000)
+        try:
+            msgs = read_keys(r, timeout=0.1)
+            assert [m.key for m in msgs[:3]] == ['a', 'b', 'right']
+            assert len(msgs) == 5003
+            assert read_keys(r, timeout=0) == []
+        finally:
+            os.close(w)
+            os.close(r)
+
+    def test_sgr_mouse_report(self):
+        msg = self._read(b'\x1b[<0;120;45M')
+        assert isinstance(msg, MouseMsg)
+        assert (msg.x, msg.y) == (119, 44)
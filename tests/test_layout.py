@@ -77,3 +77,27 @@ class TestPlace:
         lines = result.split('\n')
         assert "hi" in lines[2]
         assert lines[2].endswith("hi")
+
+
+class TestMeasureCache:
+    def test_repeated_join_is_stable(self):
+        a = "\x1b[1mA\x1b[0m\nAA"
+        first = join_horizontal(TOP, a, "B")
+        assert join_horizontal(TOP, a, "B") == first
+        assert [visible_width(l) for l in first.split('\n')] == [3, 3]
+
+    def test_place_pads_styled_lines_by_visible_width(self):
+        styled = "\x1b[1mAB\x1b[0m"
+        for h in (LEFT, CENTER, RIGHT):
+            out = place(6, 1, h, TOP, styled)
+            assert visible_width(out) == 6
+            assert styled in out
+
+
+class TestSplitGap:
+    def test_canonical_alignments_match_fractional_split(self):
+        from snaptui.layout import _split_gap
+        for gap in range(8):
+            for align in (0.0, 0.25, 0.5, 1.0):
+                before = int(gap * align)
+                assert _split_gap(gap, align) == (before, gap - before)
@@ -29,6 +29,17 @@ class MultiLineDelegate:
 
 
 class TestListNavigation:
+    def test_move_by_several_items(self):
+        lst = List(items=list(range(20)), height=5)
+        lst.move(7)
+        assert lst.cursor == 7
+        assert lst.pager_view() == "2/4"
+        lst.move(100)
+        assert lst.cursor == 19
+        lst.move(-100)
+        assert lst.cursor == 0
+        assert lst.pager_view() == "1/4"
+
     def test_move_down(self):
         lst = List(items=["a", "b", "c"], delegate=SimpleDelegate())
         assert lst.cursor == 0
@@ -157,3 +168,68 @@ class TestListSpacing:
         lines = view.split("\n")
         # With spacing=1: item, blank, item, blank, item = 5 lines
         assert len(lines) == 5
+
+
+class CountingDelegate(SimpleDelegate):
+    def __init__(self):
+        self.calls = 0
+
+    def height(self, item, width):
+        self.calls += 1
+        return 1
+
+
+class TestListPageCache:
+    def test_moves_within_page_do_not_repaginate(self):
+        d = CountingDelegate()
+        lst = List(items=list(range(20)), delegate=d, height=5)
+        lst.view()
+        d.calls = 0
+        lst.update(KeyMsg("j"))
+        lst.update(KeyMsg("j"))
+        lst.view()
+        assert d.calls == 0
+
+    def test_refresh_after_in_place_edit(self):
+        lst = List(items=list(range(10)), height=3)
+        lst.view()
+        lst.items[:] = list(range(2))
+        lst.cursor = 1
+        lst.refresh()
+        assert lst.view() == "  0\n> 1"
+
+    def test_taller_replacement_item_shrinks_page(self):
+        class TallDelegate(SimpleDelegate):
+            def render(self, item, width, selected):
+                return "\n".join([str(item)] * self.height(item, width))
+
+            def height(self, item, width):
+                return 4 if item == "tall" else 1
+
+        lst = List(items=["a", "b", "c", "d", "e"], delegate=TallDelegate(), height=4)
+        assert len(lst.view().split("\n")) == 4
+        lst.items[0] = "tall"
+        assert lst.view().split("\n") == ["tall"] * 4
+
+    def test_item_heights_are_measured_once(self):
+        d = CountingDelegate()
+        lst = List(items=[f"item{i}" for i in range(12)], delegate=d, height=5)
+        lst.pager_view()
+        lst.pager_view()
+        assert d.calls == 12
+        lst.width = 40
+        lst.pager_view()
+        assert d.calls == 24
+
+    def test_pager_follows_cursor_and_height(self):
+        lst = List(items=list(range(10)), height=3)
+        assert lst.pager_view() == "1/4"
+        lst.cursor = 9
+        lst.view()
+        assert lst.pager_view() == "4/4"
+        lst.update(KeyMsg("k"))
+        lst.update(KeyMsg("k"))
+        lst.update(KeyMsg("k"))
+        assert lst.pager_view() == "3/4"
+        lst.height = 5
+        assert lst.pager_view() == "2/2"
@@ -0,0 +1,255 @@
+"""Tests for Program internals that run without a terminal."""
+
+import threading
+
+from snaptui import Program, QuitMsg, View, WindowSizeMsg, batch, tick
+from snaptui.model import BatchCmd, TickCmd
+from snaptui.program import _InputBurst
+
+
+class _Model:
+    def init(self):
+        return None
+
+    def update(self, msg):
+        return self, None
+
+    def view(self):
+        return ""
+
+
+class _Recorder(_Model):
+    def __init__(self):
+        self.seen = []
+
+    def update(self, msg):
+        self.seen.append(msg)
+        return self, None
+
+
+class TestProcess:
+    def test_window_size_updates_program_and_model(self):
+        p = Program(_Recorder())
+        p._process(WindowSizeMsg(100, 30))
+        assert (p._width, p._height) == (100, 30)
+        assert p._resized
+        assert p.model.seen == [WindowSizeMsg(100, 30)]
+
+    def test_burst_stops_at_quit(self):
+        p = Program(_Recorder())
+        p._process(_InputBurst(["a", QuitMsg(), "b"]))
+        assert p._quit
+        assert p.model.seen == ["a"]
+
+    def test_drain_stops_at_messages_queued_on_entry(self):
+        class Refiller(_Recorder):
+            def update(self, msg):
+                self.seen.append(msg)
+                p.send(msg + 1)
+                return self, None
+
+        p = Program(Refiller())
+        p.send(0)
+        p.send(10)
+        p._drain_queue()
+        assert p.model.seen == [0, 10]
+        assert p._queue.qsize() == 2
+
+    def test_sent_list_reaches_update_whole(self):
+        p = Program(_Recorder())
+        p._process(["a", "b"])
+        assert p.model.seen == [["a", "b"]]
+
+    def test_quit_subclass_quits(self):
+        class AppQuit(QuitMsg):
+            pass
+
+        p = Program(_Recorder())
+        p._process(AppQuit())
+        assert p._quit
+        assert p.model.seen == []
+
+    def test_window_size_subclass_updates_program(self):
+        class AppResize(WindowSizeMsg):
+            pass
+
+        p = Program(_Recorder())
+        p._process(AppResize(90, 20))
+        assert (p._width, p._height) == (90, 20)
+        assert p.model.seen == [AppResize(90, 20)]
+
+
+class _Swapper(_Model):
+    def __init__(self, name, successor=None):
+        self.name = name
+        self.successor = successor
+
+    def update(self, msg):
+        return self.successor or self, None
+
+    def view(self):
+        return self.name
+
+
+class TestModelSwap:
+    def test_update_can_replace_model(self):
+        p = Program(_Swapper("first", _Swapper("second")))
+        p._renderer = _RecordingRenderer()
+        p._process("go")
+        p._render()
+        assert p.model.name == "second"
+        assert p._prev_view.content == "second"
+
+    def test_assigned_model_is_used(self):
+        p = Program(_Swapper("first"))
+        p._renderer = _RecordingRenderer()
+        p.model = _Swapper("third")
+        p._render()
+        assert p._prev_view.content == "third"
+
+
+class TestTickCmd:
+    def test_called_directly_sleeps_and_returns_msg(self):
+        cmd = tick(0, "hi")
+        assert isinstance(cmd, TickCmd)
+        assert cmd() == "hi"
+
+    def test_program_delivers_in_deadline_order(self):
+        p = Program(_Model())
+        p._exec_cmd(tick(0.05, "late"))
+        p._exec_cmd(tick(0.01, "early"))
+        assert p._queue.get(timeout=1) == "early"
+        assert p._queue.get(timeout=1) == "late"
+        p._quit = True
+        with p._timer_cond:
+            p._timer_cond.notify()
+        p._timer_thread.join(1)
+        assert not p._timer_thread.is_alive()
+
+    def test_one_timer_thread_for_many_ticks(self):
+        p = Program(_Model())
+        for i in range(20):
+            p.schedule_after(0, i)
+        assert sorted(p._queue.get(timeout=1) for _ in range(20)) == list(range(20))
+        first = p._timer_thread
+        p.schedule_after(0, "again")
+        assert p._queue.get(timeout=1) == "again"
+        assert p._timer_thread is first
+        p._quit = True
+        with p._timer_cond:
+            p._timer_cond.notify()
+
+
+class _RecordingRenderer:
+    def __init__(self):
+        self.frames = []
+        self.repaints = 0
+
+    def repaint(self):
+        self.repaints += 1
+
+    def render(self, output, width, height, *, cursor=None):
+        self.frames.append(output)
+
+
+class _Counter(_Model):
+    def __init__(self):
+        self.n = 0
+
+    def view(self):
+        return str(self.n)
+
+
+class TestFrameWriter:
+    def _program(self):
+        p = Program(_Counter())
+        p._renderer = _RecordingRenderer()
+        return p
+
+    def test_unpainted_frames_are_replaced(self):
+        p = self._program()
+        p._resized = True
+        p._render()
+        p.model.n = 1
+        p._render()
+        p._quit = True
+        p._write_frames()
+        assert p._renderer.frames == ["1"]
+        # The first frame's repaint request carries over
+        assert p._renderer.repaints == 1
+
+    def test_identical_frames_are_not_sent(self):
+        p = self._program()
+        p._render()
+        p._quit = True
+        p._write_frames()
+        p._render()
+        assert p._frame is None
+        assert p._renderer.frames == ["0"]
+
+
+class _Regions(_Counter):
+    def __init__(self):
+        super().__init__()
+        self.region = None
+        self.full_views = 0
+
+    def view(self):
+        self.full_views += 1
+        return View(content="title\nfield\nfooter", cursor=(1, 0))
+
+    def view_focused(self):
+        return self.region
+
+
+class TestFocusedView:
+    def _program(self):
+        p = Program(_Regions())
+        p._renderer = _RecordingRenderer()
+        p._render()
+        return p
+
+    def test_region_is_spliced_into_previous_frame(self):
+        p = self._program()
+        p.model.region = (1, View(content="field!", cursor=(0, 6)))
+        p._render()
+        assert p.model.full_views == 1
+        assert p._prev_view.content == "title\nfield!\nfooter"
+        assert p._prev_view.cursor == (1, 6)
+
+    def test_falls_back_to_full_view(self):
+        p = self._program()
+        p.model.region = (2, "footer\nextra")
+        p._render()
+        assert p.model.full_views == 2
+        p.model.region = (0, "title")
+        p._resized = True
+        p._render()
+        assert p.model.full_views == 3
+
+
+class TestBatch:
+    def test_nested_batches_are_flattened(self):
+        a, b, c = (lambda: "a"), (lambda: "b"), (lambda: "c")
+        cmd = batch(a, None, batch(b, c))
+        assert cmd == BatchCmd((a, b, c))
+        assert cmd() == ["a", "b", "c"]
+        assert batch(None, a) is a
+        assert batch() is None
+
+    def test_program_starts_batched_commands_independently(self):
+        release = threading.Event()
+
+        def slow():
+            release.wait(1)
+            return "slow"
+
+        p = Program(_Model())
+        p._exec_cmd(batch(slow, lambda: "fast", tick(0, "tick")))
+        got = {p._queue.get(timeout=1), p._queue.get(timeout=1)}
+        assert got == {"fast", "tick"}
+        release.set()
+        assert p._queue.get(timeout=1) == "slow"
+        p._quit = True
+        with p._timer_cond:
+            p._timer_cond.notify()
@@ -2,6 +2,7 @@
 
 from snaptui.components.progress import Progress
 from snaptui.strutil import strip_ansi
+from snaptui.style import Style
 
 
 class TestProgress:
@@ -32,3 +33,12 @@ class TestProgress:
         assert p.percent == 1.0
         p.set_percent(-0.5)
         assert p.percent == 0.0
+
+    def test_view_follows_style_and_width_changes(self):
+        p = Progress(percent=0.5, width=10, show_percent=False)
+        first = p.view()
+        assert p.view() is first
+        p.fill_style = Style().bold()
+        assert p.view().startswith("\x1b[1m█████")
+        p.width = 4
+        assert strip_ansi(p.view()) == "██░░"
@@ -0,0 +1,38 @@
+"""Tests for the line-diff Renderer."""
+
+from snaptui import renderer, terminal
+
+
+def _capture(monkeypatch) -> list[bytes]:
+    writes: list[bytes] = []
+    monkeypatch.setattr(terminal, 'write_all', lambda fd, data: writes.append(data))
+    return writes
+
+
+class TestRenderer:
+    def test_only_changed_lines_are_written(self, monkeypatch):
+        writes = _capture(monkeypatch)
+        r = renderer.Renderer()
+        r.render('one\ntwo', 80, 24)
+        r.render('one\n2', 80, 24)
+        frame = writes[-1].decode()
+        assert 'one' not in frame
+        assert '2' + terminal.ERASE_LINE_RIGHT in frame
+
+    def test_identical_frame_is_skipped(self, monkeypatch):
+        writes = _capture(monkeypatch)
+        r = renderer.Renderer()
+        r.render('same', 80, 24)
+        r.render('same', 80, 24)
+        assert len(writes) == 1
+        r.render('same', 80, 24, cursor=(0, 1))
+        assert len(writes) == 2
+
+    def test_repaint_writes_identical_frame(self, monkeypatch):
+        writes = _capture(monkeypatch)
+        r = renderer.Renderer()
+        r.render('same', 80, 24)
+        r.repaint()
+        r.render('same', 80, 24)
+        assert len(writes) == 2
+        assert 'same' in writes[-1].decode()
@@ -1,6 +1,7 @@
 """Tests for the Spinner component."""
 
 from snaptui.components.spinner import Spinner, SpinnerTickMsg, SPINNER_DOTS, SPINNER_LINE
+from snaptui.style import Style
 
 
 class TestSpinner:
@@ -44,3 +45,23 @@ class TestSpinner:
     def test_empty_frames(self):
         s = Spinner(frames=[])
         assert s.view() == ""
+        s, cmd = s.update(SpinnerTickMsg(tag=s.tag))
+        assert s.view() == ""
+        assert cmd is not None
+
+    def test_style_and_frame_changes(self):
+        s = Spinner(frames=list(SPINNER_LINE), style=Style().bold())
+        assert s.view() == "\x1b[1m|\x1b[0m"
+        s.frames = ["a", "b"]
+        assert s.view() == "\x1b[1ma\x1b[0m"
+        s.frames[0] = "x"
+        s.refresh()
+        assert s.view() == "\x1b[1mx\x1b[0m"
+        s.style = None
+        assert s.view() == "x"
+
+    def test_tick_message_is_shared_per_tag(self):
+        s = Spinner(tag=7, fps=1000)
+        msg = s.tick()()
+        assert msg == SpinnerTickMsg(tag=7)
+        assert s.tick()() is msg
@@ -1,6 +1,6 @@
 """Tests for strutil module — ANSI-aware string operations."""
 
-from snaptui.strutil import strip_ansi, visible_width, pad_right, truncate, word_wrap
+from snaptui.strutil import strip_ansi, visible_width, cached_visible_width, pad_right, truncate, fit_width, word_wrap, word_wrap_lines
 
 
 class TestStripAnsi:
@@ -34,6 +34,10 @@ class TestVisibleWidth:
     def test_mixed(self):
         assert visible_width("a漢b") == 4  # 1 + 2 + 1
 
+    def test_cached_matches_uncached(self):
+        for s in ("hello", "", "\x1b[1mbold\x1b[0m", "a漢b", "a漢b"):
+            assert cached_visible_width(s) == visible_width(s)
+
 
 class TestPadRight:
     def test_shorter(self):
@@ -92,6 +96,15 @@ class TestTruncate:
         assert visible_width(result) <= 6
         assert result.endswith("\u2026")
 
+    def test_short_styled_line_is_returned_as_is(self):
+        s = "\x1b[1mhello\x1b[0m"
+        assert truncate(s, 5) is s
+        assert truncate("漢字", 4) == "漢字"
+        assert truncate("漢字", 3) == "漢"
+
+    def test_tail_wider_than_width(self):
+        assert truncate("hello world", 2, "...") == ".."
+
     def test_tail_with_ansi(self):
         s = "\x1b[1mhello world\x1b[0m"
         result = truncate(s, 8, "...")
@@ -99,6 +112,30 @@ class TestTruncate:
         assert result.endswith("...")
 
 
+class TestFitWidth:
+    def test_pads_short(self):
+        assert fit_width("hi", 5) == "hi   "
+
+    def test_truncates_long(self):
+        assert fit_width("hello world", 5) == "hello"
+
+    def test_zero_width(self):
+        assert fit_width("hello", 0) == ""
+
+    def test_ansi_preserved(self):
+        s = "\x1b[1mhi\x1b[0m"
+        assert fit_width(s, 4) == s + "  "
+
+    def test_cjk_boundary_padded(self):
+        # "漢字" is width 4; at width 3 only "漢" fits, leaving one column
+        assert fit_width("漢字", 3) == "漢 "
+
+    def test_matches_pad_truncate(self):
+        for s in ["", "abc", "\x1b[31mred text\x1b[0m", "a漢b字c"]:
+            for w in range(1, 10):
+                assert fit_width(s, w) == pad_right(truncate(s, w), w)
+
+
 class TestWordWrap:
     def test_short_line(self):
         assert word_wrap("hello", 10) == "hello"
@@ -116,3 +153,12 @@ class TestWordWrap:
         result = word_wrap("abcdefghij", 5)
         lines = result.split('\n')
         assert all(visible_width(l) <= 5 for l in lines)
+
+
+class TestWordWrapLines:
+    def test_matches_word_wrap(self):
+        s = "the quick brown fox\njumps over the lazy dog"
+        assert word_wrap_lines(s, 8) == word_wrap(s, 8).split('\n')
+
+    def test_zero_width(self):
+        assert word_wrap_lines("a\nb", 0) == ["a", "b"]
@@ -29,6 +29,12 @@ class TestStyleBasic:
         assert "\x1b[38;2;255;255;255m" in result
         assert "\x1b[48;2;0;0;0m" in result
 
+    def test_layout_added_after_plain_render(self):
+        base = Style().bold()
+        assert base.render("hi") == "\x1b[1mhi\x1b[0m"
+        assert base.padding(0, 1).render("hi") == "\x1b[1m hi \x1b[0m"
+        assert base.margin(0, 1).render("hi") == " \x1b[1mhi\x1b[0m "
+
 
 class TestStylePadding:
     def test_padding_horizontal(self):
@@ -45,6 +51,13 @@ class TestStylePadding:
         assert strip_ansi(result) == " hi "
 
 
+    def test_padding_align_and_height_share_one_width(self):
+        result = Style().padding(1, 1).align(0.5).height(5).render("a\nbbb")
+        assert result.split('\n') == [
+            "     ", "  a  ", " bbb ", "     ", "     ",
+        ]
+
+
 class TestStyleWidth:
     def test_width_pads(self):
         result = Style().width(10).render("hi")
@@ -122,3 +135,25 @@ class TestStyleImmutability:
         assert base._bold is False
         assert bold_version._bold is True
         assert bold_version._fg_color == "#FF0000"
+
+    def test_derived_style_does_not_reuse_cached_prefix(self):
+        base = Style().bold()
+        assert base.render("x") == "\x1b[1mx\x1b[0m"
+        assert base.italic().render("x") == "\x1b[1m\x1b[3mx\x1b[0m"
+        assert base.render("x") == "\x1b[1mx\x1b[0m"
+
+    def test_copy_carries_every_field(self):
+        base = Style()
+        for i, slot in enumerate(Style.__slots__):
+            object.__setattr__(base, slot, i)
+        new = base._copy()
+        for i, slot in enumerate(Style.__slots__):
+            memo = slot in ('_prefix', '_simple')
+            assert getattr(new, slot) == (None if memo else i), slot
+
+    def test_repeated_render_is_stable(self):
+        s = Style().padding(0, 1).border(ROUNDED_BORDER)
+        first = s.render("a\nbb")
+        assert s.render("a\nbb") == first
+        assert s.render("a\nbbb") != first
+        assert s.bold().render("a\nbb") != first
@@ -136,3 +136,84 @@ class TestTableScrolling:
             t, _ = t.update(KeyMsg("j"))
         assert t.cursor == 4
         assert t.y_offset > 0
+
+    def test_move_by_several_rows(self):
+        t = Table(columns=[Column("A")], rows=[[str(i)] for i in range(10)], height=3)
+        t.move(-1)
+        assert t.cursor == -1
+        t.move(5)
+        assert (t.cursor, t.y_offset) == (4, 2)
+        t.move(100)
+        assert (t.cursor, t.y_offset) == (9, 7)
+        t.move(-100)
+        assert (t.cursor, t.y_offset) == (0, 0)
+
+
+class TestTableColumnWidths:
+    def test_append_row_widens_column(self):
+        t = Table(columns=[Column("A"), Column("B", width=3)], rows=[["x", "y"]])
+        assert t._col_widths() == [1, 3]
+        t.append_row(["wide", "z"])
+        assert t._col_widths() == [4, 3]
+
+    def test_set_rows_recomputes(self):
+        t = Table(columns=[Column("A")], rows=[["long value"]])
+        assert t._col_widths() == [10]
+        t.set_rows([["ab"]])
+        assert t._col_widths() == [2]
+
+    def test_refresh_after_in_place_edit(self):
+        t = Table(columns=[Column("A")], rows=[["a"]])
+        assert t._col_widths() == [1]
+        t.rows[0][0] = "abc"
+        t.refresh()
+        assert t._col_widths() == [3]
+
+    def test_in_place_cell_edit_is_measured(self):
+        t = Table(columns=[Column("A")], rows=[["a"]])
+        t.view()
+        t.rows[0][0] = "abcdef"
+        assert strip_ansi(t.view()).split("\n")[2] == "abcdef"
+
+    def test_replaced_row_is_measured(self):
+        t = Table(columns=[Column("A")], rows=[["a"]])
+        t.view()
+        t.rows.pop()
+        t.rows.append(["wide-cell"])
+        assert strip_ansi(t.view()).split("\n")[2] == "wide-cell"
+
+    def test_narrowed_cell_shrinks_column(self):
+        t = Table(columns=[Column("A")], rows=[["abcdef"], ["b"]])
+        assert t._col_widths() == [6]
+        t.rows[0] = ["a"]
+        assert t._col_widths() == [1]
+
+    def test_new_columns_recompute(self):
+        t = Table(columns=[Column("A")], rows=[["a", "bbbb"]])
+        assert t._col_widths() == [1]
+        t.columns = [Column("A"), Column("B")]
+        assert t._col_widths() == [1, 4]
+
+    def test_short_rows_are_padded(self):
+        t = Table(columns=[Column("A"), Column("B")], rows=[["x", "yy"], ["z"]])
+        lines = strip_ansi(t.view()).split("\n")
+        assert lines[3] == "z    "
+        assert visible_width(lines[3]) == visible_width(lines[2])
+
+    def test_fit_visible_measures_window_only(self):
+        rows = [["a"], ["bb"], ["a much longer cell"]]
+        t = Table(columns=[Column("A")], rows=rows, height=2, fit_visible=True)
+        assert t._col_widths() == [2]
+        t.y_offset = 1
+        assert t._col_widths() == [18]
+        t.fit_visible = False
+        t.y_offset = 0
+        assert t._col_widths() == [18]
+
+    def test_header_follows_column_changes(self):
+        t = Table(columns=[Column("A")], rows=[["x"]])
+        assert strip_ansi(t.view()).split("\n")[0] == "A"
+        t.columns = [Column("Name", width=6)]
+        lines = strip_ansi(t.view()).split("\n")
+        assert lines[0] == "Name  "
+        assert lines[1] == "─" * 6
@@ -0,0 +1,137 @@
+"""Tests for the TextArea component."""
+
+from snaptui.components.textarea import TextArea
+from snaptui.keys import KeyMsg, PasteMsg
+from snaptui.strutil import strip_ansi
+
+
+def _area(text: str, **kw) -> TextArea:
+    ta = TextArea(width=20, height=4, **kw)
+    ta.set_value(text)
+    ta.focus()
+    return ta
+
+
+class TestTextAreaView:
+    def test_view_pads_to_height(self):
+        ta = TextArea(height=3)
+        ta.set_value('one\ntwo')
+        assert ta.view().split('\n') == ['one', 'two', '']
+
+    def test_cursor_row_is_styled(self):
+        ta = _area('abc\ndef')
+        lines = ta.view().split('\n')
+        assert '\x1b[7ma' in lines[0]
+        assert lines[1] == 'def'
+
+    def test_view_tracks_edits_on_cached_rows(self):
+        ta = _area('abc\ndef\nghi')
+        ta.view()
+        ta.update(KeyMsg('down'))
+        ta.update(KeyMsg('x', 'x'))
+        lines = [strip_ansi(l) for l in ta.view().split('\n')]
+        assert lines[:3] == ['abc', 'xdef', 'ghi']
+        # Moving off the row renders it unstyled
+        ta.update(KeyMsg('up'))
+        assert ta.view().split('\n')[1] == 'xdef'
+
+    def test_merge_lines_shifts_rows(self):
+        ta = _area('a\nb\nc')
+        ta.view()
+        ta.update(KeyMsg('down'))
+        ta.update(KeyMsg('backspace'))
+        lines = [strip_ansi(l) for l in ta.view().split('\n')]
+        assert lines[:3] == ['ab', 'c', '']
+
+    def test_line_numbers_and_width_change(self):
+        ta = _area('hello world', show_line_numbers=True)
+        ta.blur()
+        assert ta.view().split('\n')[0] == '1 hello world'
+        ta.width = 7
+        assert ta.view().split('\n')[0] == '1 hello'
+
+
+class TestTextAreaEditing:
+    def test_typing_is_visible_through_lines_and_value(self):
+        ta = _area('ac')
+        ta.update(KeyMsg('right'))
+        ta.update(KeyMsg('b', 'b'))
+        assert ta.lines == ['abc']
+        ta.update(KeyMsg('backspace'))
+        ta.update(KeyMsg('delete'))
+        assert ta.value == 'a'
+        assert ta.cursor_col == 1
+
+    def test_external_line_edit_is_respected(self):
+        ta = _area('abc')
+        ta.update(KeyMsg('x', 'x'))
+        ta.lines[0] = 'hello'
+        ta.cursor_col = 5
+        ta.update(KeyMsg('!', '!'))
+        assert ta.value == 'hello!'
+
+    def test_backspace_after_lines_replaced_with_empty_line(self):
+        ta = _area('')
+        for ch in 'hello':
+            ta.update(KeyMsg(ch, ch))
+        ta.lines = ['']
+        assert ta.cursor_col == 0
+        ta.update(KeyMsg('backspace'))
+        assert ta.lines == ['']
+
+    def test_backspace_with_column_past_externally_emptied_line(self):
+        ta = _area('hello')
+        ta.update(KeyMsg('end'))
+        ta.update(KeyMsg('x', 'x'))
+        ta.lines[0] = ''
+        assert ta.cursor_col == 6
+        ta.update(KeyMsg('backspace'))
+        assert ta.lines == ['']
+        assert ta.cursor_col == 0
+
+    def test_setting_shorter_lines_clamps_cursor(self):
+        ta = _area('hello')
+        ta.update(KeyMsg('end'))
+        ta.lines = ['hi']
+        assert ta.cursor_col == 2
+        ta.update(KeyMsg('backspace'))
+        assert ta.lines == ['h']
+
+    def test_constructor_lines(self):
+        ta = TextArea(lines=['one', 'two'], cursor_row=1, cursor_col=3)
+        ta.focus()
+        ta.update(KeyMsg('s', 's'))
+        assert ta.lines == ['one', 'twos']
+
+    def test_paste_single_line(self):
+        ta = _area('ad')
+        ta.update(KeyMsg('right'))
+        ta.update(PasteMsg('bc'))
+        assert ta.value == 'abcd'
+        assert ta.cursor_col == 3
+
+    def test_paste_multi_line(self):
+        ta = _area('[]')
+        ta.update(KeyMsg('right'))
+        ta.update(PasteMsg('one\r\ntwo\nthree'))
+        assert ta.lines == ['[one', 'two', 'three]']
+        assert (ta.cursor_row, ta.cursor_col) == (2, 5)
+
+    def test_paste_drops_control_characters(self):
+        ta = _area('')
+        ta.update(PasteMsg('a\x1b[2Jb\x07c\nd\te'))
+        assert ta.lines == ['a[2Jbc', 'd    e']
+
+    def test_navigation_and_kill(self):
+        ta = _area('\n'.join('line%d' % i for i in range(10)))
+        ta.update(KeyMsg('pgdown'))
+        assert ta.cursor_row == 4
+        assert ta.y_offset == 1
+        ta.update(KeyMsg('ctrl+e'))
+        ta.update(KeyMsg('left'))
+        ta.update(KeyMsg('ctrl+k'))
+        assert ta.lines[4] == 'line'
+        ta.update(KeyMsg('enter'))
+        assert ta.lines[4:6] == ['line', '']
+        ta.update(KeyMsg('pgup'))
+        assert (ta.cursor_row, ta.cursor_col) == (1, 0)
@@ -0,0 +1,184 @@
+"""Tests for the TextInput component."""
+
+from snaptui.components.textinput import TextInput
+from snaptui.keys import KeyMsg, PasteMsg
+from snaptui.model import TickCmd
+from snaptui.strutil import strip_ansi
+from snaptui.style import Style
+
+
+def _focused(value: str = '', cursor: int | None = None) -> TextInput:
+    ti = TextInput(value=value, cursor=len(value) if cursor is None else cursor)
+    ti.focus()
+    return ti
+
+
+def _type(ti: TextInput, text: str) -> None:
+    for ch in text:
+        ti.update(KeyMsg('space', ' ') if ch == ' ' else KeyMsg(ch, ch))
+
+
+class TestTextInputEditing:
+    def test_constructor_value_and_cursor(self):
+        ti = TextInput(value='hello', cursor=2)
+        assert ti.value == 'hello'
+        assert ti.cursor == 2
+
+    def test_constructor_clamps_cursor(self):
+        assert TextInput(value='hi', cursor=9).cursor == 2
+        assert TextInput(value='hi', cursor=-1).cursor == 0
+
+    def test_typing_appends(self):
+        ti = _focused()
+        _type(ti, 'hi there')
+        assert ti.value == 'hi there'
+        assert ti.cursor == 8
+
+    def test_insert_mid_string(self):
+        ti = _focused('held', cursor=3)
+        _type(ti, 'l')
+        assert ti.value == 'helld'
+        assert ti.cursor == 4
+
+    def test_backspace_and_delete(self):
+        ti = _focused('abcd', cursor=2)
+        ti.update(KeyMsg('backspace'))
+        assert ti.value == 'acd'
+        ti.update(KeyMsg('delete'))
+        assert ti.value == 'ad'
+        assert ti.cursor == 1
+
+    def test_cursor_movement(self):
+        ti = _focused('abc')
+        ti.update(KeyMsg('left'))
+        assert ti.cursor == 2
+        ti.update(KeyMsg('home'))
+        assert ti.cursor == 0
+        ti.update(KeyMsg('left'))
+        assert ti.cursor == 0
+        ti.update(KeyMsg('end'))
+        assert ti.cursor == 3
+        ti.update(KeyMsg('right'))
+        assert ti.cursor == 3
+
+    def test_kill_line(self):
+        ti = _focused('hello world', cursor=5)
+        ti.update(KeyMsg('ctrl+k'))
+        assert ti.value == 'hello'
+        ti = _focused('hello world', cursor=6)
+        ti.update(KeyMsg('ctrl+u'))
+        assert ti.value == 'world'
+        assert ti.cursor == 0
+
+    def test_kill_word(self):
+        ti = _focused('foo bar  ')
+        ti.update(KeyMsg('ctrl+w'))
+        assert ti.value == 'foo '
+        ti.update(KeyMsg('ctrl+w'))
+        assert ti.value == ''
+
+    def test_char_limit(self):
+        ti = _focused()
+        ti.char_limit = 3
+        _type(ti, 'abcdef')
+        assert ti.value == 'abc'
+
+    def test_set_value_moves_cursor_to_end(self):
+        ti = _focused()
+        ti.set_value('xyz')
+        assert ti.cursor == 3
+        _type(ti, '!')
+        assert ti.value == 'xyz!'
+
+    def test_paste_inserts_at_cursor(self):
+        ti = _focused('ad', cursor=1)
+        ti.update(PasteMsg('b\r\nc\x07'))
+        assert ti.value == 'ab cd'
+        assert ti.cursor == 4
+
+    def test_paste_respects_char_limit(self):
+        ti = _focused('ab')
+        ti.char_limit = 4
+        ti.update(PasteMsg('cdef'))
+        assert ti.value == 'abcd'
+
+    def test_message_subclasses_are_handled(self):
+        class AppKey(KeyMsg):
+            pass
+
+        class AppPaste(PasteMsg):
+            pass
+
+        ti = _focused()
+        ti.update(AppKey('a', 'a'))
+        ti.update(AppPaste('bc'))
+        ti.update(AppKey('backspace'))
+        assert ti.value == 'ab'
+
+    def test_assign_value_clamps_cursor(self):
+        ti = _focused('hello')
+        ti.value = 'hi'
+        assert ti.cursor == 2
+
+
+class TestTextInputView:
+    def test_placeholder_when_blurred_and_empty(self):
+        ti = TextInput(placeholder='name')
+        assert strip_ansi(ti.view()) == '> name'
+
+    def test_cursor_rendered_inline(self):
+        ti = _focused('abc', cursor=1)
+        assert strip_ansi(ti.view()) == '> abc'
+        assert '\x1b[7mb' in ti.view()
+
+    def test_cursor_at_end_shows_block(self):
+        ti = _focused('abc')
+        assert strip_ansi(ti.view()) == '> abc '
+
+    def test_styled_parts_follow_changes(self):
+        ti = TextInput(placeholder='name', prompt_style=Style().bold())
+        ti.label('Name')
+        ti.label_style = Style().italic()
+        assert ti.view() == '\x1b[3mName\x1b[0m\n\x1b[1m> \x1b[0mname'
+        ti.prompt = '$ '
+        ti.placeholder_style = Style().dim()
+        assert ti.view().split('\n')[1] == '\x1b[1m$ \x1b[0m\x1b[2mname\x1b[0m'
+        ti.label_style = None
+        assert ti.view().split('\n')[0] == 'Name'
+
+
+class TestTextInputBlink:
+    def _blinking(self) -> TextInput:
+        ti = _focused()
+        ti.cursor_blink = True
+        return ti
+
+    def test_typing_does_not_start_more_timers(self):
+        ti = self._blinking()
+        _, first = ti.update(KeyMsg('a', 'a'))
+        assert isinstance(first, TickCmd)
+        _, cmd = ti.update(KeyMsg('b', 'b'))
+        assert cmd is None
+
+    def test_tick_while_typing_holds_cursor(self):
+        ti = self._blinking()
+        _, cmd = ti.update(KeyMsg('a', 'a'))
+        _, again = ti.update(cmd.msg)
+        assert ti._cursor_visible
+        assert again.msg == cmd.msg
+        assert 0 < again.delay <= 0.53
+
+    def test_tick_after_pause_toggles(self):
+        ti = self._blinking()
+        _, cmd = ti.update(KeyMsg('a', 'a'))
+        ti._blink_hold = 0.0
+        ti.update(cmd.msg)
+        assert not ti._cursor_visible
+
+    def test_refocus_invalidates_old_timer(self):
+        ti = self._blinking()
+        _, cmd = ti.update(KeyMsg('a', 'a'))
+        ti.focus()
+        ti._blink_hold = 0.0
+        _, new = ti.update(cmd.msg)
+        assert new is not None and new.msg != cmd.msg
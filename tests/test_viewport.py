@@ -0,0 +1,72 @@
+"""Tests for the Viewport component."""
+
+from snaptui.components.viewport import Viewport
+from snaptui.keys import KeyMsg
+from snaptui.model import WindowSizeMsg
+
+
+def _viewport(n: int = 10, **kw) -> Viewport:
+    vp = Viewport(**kw)
+    vp.set_content('\n'.join(f'line{i}' for i in range(n)))
+    return vp
+
+
+class TestViewportScrolling:
+    def test_scroll_is_clamped_to_content(self):
+        vp = _viewport(width=10, height=4)
+        vp.update(KeyMsg('end'))
+        assert vp.y_offset == 6
+        assert vp.at_bottom
+        vp.update(KeyMsg('down'))
+        assert vp.y_offset == 6
+        vp.update(KeyMsg('home'))
+        assert vp.at_top
+
+    def test_max_offset_follows_height(self):
+        vp = _viewport(width=10, height=4)
+        vp.goto_bottom()
+        assert vp.y_offset == 6
+        vp.update(WindowSizeMsg(10, 8))
+        vp.goto_bottom()
+        assert vp.y_offset == 2
+
+    def test_shorter_content_clamps_offset(self):
+        vp = _viewport(width=10, height=4)
+        vp.goto_bottom()
+        vp.set_content('a\nb\nc\nd\ne')
+        assert vp.y_offset == 1
+        assert vp.total_lines == 5
+
+
+class TestViewportView:
+    def test_view_fits_and_pads_lines(self):
+        vp = Viewport(width=6, height=3)
+        vp.set_content('abcdefgh ij\nk')
+        assert vp.view().split('\n') == ['abcdef', 'gh ij ', 'k     ']
+
+    def test_width_change_refits_cached_lines(self):
+        vp = _viewport(3, width=8, height=3)
+        assert vp.view().split('\n')[0] == 'line0   '
+        vp.width = 4
+        assert vp.view().split('\n')[0] == 'line'
+
+    def test_set_content_replaces_cached_lines(self):
+        vp = _viewport(3, width=8, height=3)
+        vp.view()
+        vp.set_content('other')
+        assert vp.view().split('\n') == ['other   ', ' ' * 8, ' ' * 8]
+
+    def test_same_content_keeps_scroll_position(self):
+        vp = _viewport(width=10, height=4)
+        vp.line_down(3)
+        vp.set_content('\n'.join(f'line{i}' for i in range(10)))
+        assert vp.y_offset == 3
+        assert vp.view().split('\n')[0] == 'line3     '
+
+    def test_caches_are_not_constructor_arguments(self):
+        vp = Viewport(10, 4, 0)
+        assert vp == Viewport(10, 4, 0)
+        vp.set_content('x')
+        vp.view()
+        assert vp == Viewport(10, 4, 0, ['x'])
+        assert '_rendered' not in repr(vp)